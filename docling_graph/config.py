@@ -105,6 +105,8 @@ class PipelineConfig(BaseModel):
     use_chunking: bool = True
     llm_consolidation: bool = False
     max_batch_size: int = 1
+    max_concurrent_pages: int = 1
+    fast_token_estimate: bool = False
 
     # Export settings (with defaults)
     export_format: Literal["csv", "cypher"] = Field(default="csv")
@@ -164,6 +166,8 @@ class PipelineConfig(BaseModel):
             "docling_config": self.docling_config,
             "use_chunking": self.use_chunking,
             "llm_consolidation": self.llm_consolidation,
+            "max_concurrent_pages": self.max_concurrent_pages,
+            "fast_token_estimate": self.fast_token_estimate,
             "model_override": self.model_override,
             "provider_override": self.provider_override,
             "export_format": self.export_format,
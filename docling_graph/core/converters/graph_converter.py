@@ -10,13 +10,14 @@ Key Concepts:
 - Components (is_entity=False): Embedded as dictionaries in parent nodes
 """
 
-from typing import Any, List, Mapping, Optional, Set
+from typing import Any, Dict, List, Mapping, Optional, Set
 
 import networkx as nx
 from pydantic import BaseModel
 from rich import print as rich_print
 
 from ..utils.graph_cleaner import GraphCleaner, validate_graph_structure
+from ..utils.model_introspection import is_scalar_only_model
 from ..utils.stats_calculator import calculate_graph_stats
 from .config import GraphConfig
 from .models import Edge, GraphMetadata
@@ -128,14 +129,20 @@ class GraphConverter:
         graph = nx.DiGraph()
         visited_ids: Set[str] = set()
 
+        # Per-conversion identity map: id(instance) -> node ID. Instances shared
+        # across the tree are fingerprinted once; scoped to this call so the
+        # converter stays stateless and ids cannot outlive their instances.
+        node_ids: Dict[int, str] = {}
+
         # First pass: create nodes
         for model in model_instances:
-            self._create_nodes_pass(model, graph, visited_ids)
+            self._create_nodes_pass(model, graph, visited_ids, node_ids)
 
         # Second pass: create edges
         edges_to_add: List[Edge] = []
+        walked: Set[int] = set()
         for model in model_instances:
-            edges = self._create_edges_pass(model, visited_ids)
+            edges = self._create_edges_pass(model, visited_ids, node_ids, walked)
             edges_to_add.extend(edges)
 
         # Add edges to graph
@@ -186,6 +193,7 @@ class GraphConverter:
         model: BaseModel,
         graph: nx.DiGraph,
         visited_ids: Set[str],
+        node_ids: Dict[int, str] | None = None,
     ) -> None:
         """
         Recursively create nodes from model and nested entities.
@@ -201,7 +209,7 @@ class GraphConverter:
             return
 
         # Get node ID from registry
-        node_id = self._get_node_id(model)
+        node_id = self._get_node_id(model, node_ids)
 
         if node_id in visited_ids:
             return
@@ -216,6 +224,12 @@ class GraphConverter:
             "__class__": model.__class__.__name__,
         }
 
+        if is_scalar_only_model(type(model)) and not model.__pydantic_extra__:
+            # Fast path: no nested models possible, copy fields as-is
+            node_attrs.update(model)
+            graph.add_node(node_id, **node_attrs)
+            return
+
         # Add all fields from model
         for field_name, field_value in model:
             if isinstance(field_value, BaseModel):
@@ -225,7 +239,7 @@ class GraphConverter:
                 if is_nested_entity:
                     # Entity: set to None (will be linked via edge)
                     node_attrs[field_name] = None
-                    self._create_nodes_pass(field_value, graph, visited_ids)
+                    self._create_nodes_pass(field_value, graph, visited_ids, node_ids)
                 else:
                     # Component: embed as dictionary to preserve data
                     node_attrs[field_name] = field_value.model_dump()
@@ -241,7 +255,7 @@ class GraphConverter:
                         # List of entities: set to None (will be linked via edges)
                         node_attrs[field_name] = None
                         for item in field_value:
-                            self._create_nodes_pass(item, graph, visited_ids)
+                            self._create_nodes_pass(item, graph, visited_ids, node_ids)
                     else:
                         # List of components: embed as list of dictionaries
                         node_attrs[field_name] = [item.model_dump() for item in field_value]
@@ -257,12 +271,15 @@ class GraphConverter:
         self,
         model: BaseModel,
         visited_ids: Set[str],
+        node_ids: Dict[int, str] | None = None,
+        walked: Set[int] | None = None,
     ) -> List[Edge]:
         """
         Recursively create edges from model relationships.
 
         Only creates edges for entities (is_entity=True).
         Components (is_entity=False) are embedded and don't get edges.
+        An instance already in ``walked`` has had its edges emitted and is skipped.
         """
         edges: List[Edge] = []
 
@@ -272,7 +289,17 @@ class GraphConverter:
             # Components don't participate in edge creation
             return edges
 
-        source_id = self._get_node_id(model)
+        if is_scalar_only_model(type(model)) and not model.__pydantic_extra__:
+            # Scalar-only models have no relationships to follow
+            return edges
+
+        if walked is not None:
+            if id(model) in walked:
+                # Same instance reached again: its edges are already collected
+                return edges
+            walked.add(id(model))
+
+        source_id = self._get_node_id(model, node_ids)
 
         # Process all fields
         for field_name, field_value in model:
@@ -284,7 +311,7 @@ class GraphConverter:
                 is_nested_entity = get_model_config_value(field_value, "is_entity", True)
 
                 if is_nested_entity:
-                    target_id = self._get_node_id(field_value)
+                    target_id = self._get_node_id(field_value, node_ids)
                     edges.append(
                         Edge(
                             source=source_id,
@@ -294,7 +321,9 @@ class GraphConverter:
                         )
                     )
                     # Recursively process nested entity
-                    edges.extend(self._create_edges_pass(field_value, visited_ids))
+                    edges.extend(
+                        self._create_edges_pass(field_value, visited_ids, node_ids, walked)
+                    )
                 # Components are embedded, no edge needed
 
             elif isinstance(field_value, list) and field_value:
@@ -304,7 +333,7 @@ class GraphConverter:
 
                     if is_list_entity:
                         for item in field_value:
-                            target_id = self._get_node_id(item)
+                            target_id = self._get_node_id(item, node_ids)
                             edges.append(
                                 Edge(
                                     source=source_id,
@@ -314,14 +343,28 @@ class GraphConverter:
                                 )
                             )
                             # Recursively process nested entity
-                            edges.extend(self._create_edges_pass(item, visited_ids))
+                            edges.extend(
+                                self._create_edges_pass(item, visited_ids, node_ids, walked)
+                            )
                     # Lists of components are embedded, no edges needed
 
         return edges
 
-    def _get_node_id(self, model: BaseModel) -> str:
-        """Get deterministic node ID from registry."""
-        return self.registry.get_node_id(model)
+    def _get_node_id(self, model: BaseModel, node_ids: Dict[int, str] | None = None) -> str:
+        """
+        Get deterministic node ID from registry.
+
+        When ``node_ids`` is given, IDs are memoized by instance identity so a
+        model referenced several times is only fingerprinted once per conversion.
+        """
+        if node_ids is None:
+            return self.registry.get_node_id(model)
+        key = id(model)
+        node_id = node_ids.get(key)
+        if node_id is None:
+            node_id = self.registry.get_node_id(model)
+            node_ids[key] = node_id
+        return node_id
 
     def _get_edge_label(self, model: BaseModel, field_name: str) -> str | None:
         """
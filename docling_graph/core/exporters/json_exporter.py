@@ -1,9 +1,10 @@
 """JSON exporter for graph serialization."""
 
+import codecs
 import json
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterable, Iterator, List, Optional, cast
 
 import networkx as nx
 
@@ -14,6 +15,9 @@ from ..utils.string_formatter import json_serializable
 class JSONExporter:
     """Export graph to JSON format."""
 
+    # Output is streamed element by element through a buffered file
+    WRITE_BUFFER_SIZE = 1 << 20
+
     def __init__(self, config: ExportConfig | None = None) -> None:
         """Initialize JSON exporter.
 
@@ -37,17 +41,88 @@ class JSONExporter:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        graph_dict = self._graph_to_dict(graph)
+        if not self._can_stream():
+            # Compact (or non-space) indentation: serialize in memory and write once;
+            # json.dump() issues a write per token
+            content = json.dumps(
+                self._graph_to_dict(graph),
+                indent=self.config.JSON_INDENT,
+                ensure_ascii=self.config.ENSURE_ASCII,
+                default=json_serializable,
+            )
+            with open(output_path, "w", encoding=self.config.JSON_ENCODING) as f:
+                f.write(content)
+            return
+
+        # Stream node/edge records instead of materializing the whole document;
+        # the large write buffer keeps the number of write calls low.
+        with open(output_path, "wb", buffering=self.WRITE_BUFFER_SIZE) as f:
+            f.writelines(self._iter_json_chunks(graph))
+
+    def _iter_json_chunks(self, graph: nx.DiGraph) -> Iterator[bytes]:
+        """Yield the encoded JSON document for a graph piece by piece.
 
-        with open(output_path, "w", encoding=self.config.JSON_ENCODING) as f:
-            json.dump(
-                graph_dict,
-                f,
+        Produces the same bytes as dumping ``_graph_to_dict(graph)`` in one go,
+        but only one node or edge record is held in memory at a time.
+
+        Args:
+            graph: NetworkX directed graph.
+
+        Yields:
+            Encoded chunks of the JSON document.
+        """
+        encoder = codecs.getincrementalencoder(self.config.JSON_ENCODING)()
+        indent = " " * self.config.JSON_INDENT
+        # Records sit two levels deep: {"nodes": [ <record>, ... ]}
+        record_break = "\n" + indent * 2
+
+        def dumps(obj: Any) -> str:
+            return json.dumps(
+                obj,
                 indent=self.config.JSON_INDENT,
                 ensure_ascii=self.config.ENSURE_ASCII,
                 default=json_serializable,
             )
 
+        def encode_record(record: Dict[str, Any]) -> bytes:
+            return encoder.encode(dumps(record).replace("\n", record_break))
+
+        def encode_section(key: str, records: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+            yield encoder.encode(f'{indent}"{key}": [')
+            empty = True
+            for record in records:
+                yield encoder.encode(record_break if empty else "," + record_break)
+                yield encode_record(record)
+                empty = False
+            yield encoder.encode("]" if empty else "\n" + indent + "]")
+
+        yield encoder.encode("{\n")
+        yield from encode_section(
+            "nodes", ({"id": node_id, **data} for node_id, data in graph.nodes(data=True))
+        )
+        yield encoder.encode(",\n")
+        yield from encode_section(
+            "edges",
+            (
+                {"source": source, "target": target, **data}
+                for source, target, data in graph.edges(data=True)
+            ),
+        )
+        metadata = {"node_count": graph.number_of_nodes(), "edge_count": graph.number_of_edges()}
+        yield encoder.encode(
+            f',\n{indent}"metadata": ' + dumps(metadata).replace("\n", "\n" + indent) + "\n}"
+        )
+        yield encoder.encode("", final=True)
+
+    def _can_stream(self) -> bool:
+        """Check whether the streamed layout matches ``json.dump`` for the config.
+
+        Streaming frames records with newlines and space indentation, so it needs
+        a non-negative integer indent.
+        """
+        indent = self.config.JSON_INDENT
+        return isinstance(indent, int) and not isinstance(indent, bool) and indent >= 0
+
     def validate_graph(self, graph: nx.DiGraph) -> bool:
         """Validate that graph is not empty.
 
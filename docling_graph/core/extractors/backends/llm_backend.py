@@ -3,7 +3,7 @@ LLM (Language Model) extraction backend.
 Handles document extraction using LLM models (local or API) with model-aware prompting.
 """
 
-import gc
+import asyncio
 import json
 import logging
 from typing import List, Optional, Type
@@ -170,6 +170,33 @@ class LlmBackend:
             )
             return None
 
+    async def extract_from_markdown_async(
+        self,
+        markdown: str,
+        template: Type[BaseModel],
+        context: str = "document",
+        is_partial: bool = False,
+    ) -> BaseModel | None:
+        """
+        Async variant of ``extract_from_markdown`` for concurrent page extraction.
+
+        The LLM clients are synchronous, so the blocking call runs in a worker
+        thread and several requests can be in flight at once. Only use it with
+        thread-safe clients: vLLM's SIGALRM timeout fails outside the main thread.
+
+        Args:
+            markdown (str): Markdown content to extract from.
+            template (Type[BaseModel]): Pydantic model template.
+            context (str): Context description for the extraction (e.g., "page 1", "full document").
+            is_partial (bool): If True, use the partial/chunk-based prompt.
+
+        Returns:
+            Optional[BaseModel]: Extracted and validated Pydantic model instance, or None if failed.
+        """
+        return await asyncio.to_thread(
+            self.extract_from_markdown, markdown, template, context, is_partial
+        )
+
     def consolidate_from_pydantic_models(
         self,
         raw_models: List[BaseModel],
@@ -182,6 +209,9 @@ class LlmBackend:
         Handles both single-prompt and Chain of Density (multi-turn) consolidation
         based on model capability.
 
+        The input models are only serialized, never re-validated, so callers
+        holding already-validated data may build them with ``model_construct``.
+
         Args:
             raw_models: The list of raw models from each batch/page.
             programmatic_model: The programmatically merged model (as a draft).
@@ -293,11 +323,10 @@ class LlmBackend:
                 cleanup_fn = getattr(self.client, "cleanup", None)
                 if callable(cleanup_fn):
                     cleanup_fn()
+                # Dropping the reference is enough: clients hold no reference
+                # cycles, so a forced full gc.collect() would only cost time
                 del self.client
 
-            # Force garbage collection
-            gc.collect()
-
             rich_print("[blue][LlmBackend][/blue] [green]Cleaned up resources[/green]")
 
         except Exception as e:
@@ -10,6 +10,7 @@ Supports provider-specific configurations from centralized registry.
 
 import logging
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Callable, List
 
 from rich import print as rich_print
@@ -18,6 +19,8 @@ from docling_graph.llm_clients.config import ProviderConfig, get_provider_config
 
 logger = logging.getLogger(__name__)
 
+CHUNK_SEPARATOR = "\n\n---CHUNK BOUNDARY---\n\n"
+
 
 @dataclass
 class ChunkBatch:
@@ -39,12 +42,12 @@ class ChunkBatch:
     def chunk_count(self) -> int:
         return len(self.chunks)
 
-    @property
+    @cached_property
     def combined_text(self) -> str:
-        """Combine all chunks with separators for LLM."""
-        separator = "\n\n---CHUNK BOUNDARY---\n\n"
-        return separator.join(
-            [f"[Chunk {i + 1}/{len(self.chunks)}]\n{chunk}" for i, chunk in enumerate(self.chunks)]
+        """Combine all chunks with separators for LLM (built once per batch)."""
+        total = len(self.chunks)
+        return CHUNK_SEPARATOR.join(
+            [f"[Chunk {i}/{total}]\n{chunk}" for i, chunk in enumerate(self.chunks, start=1)]
         )
 
 
@@ -66,6 +69,9 @@ class ChunkBatcher:
 
     SAFETY_MARGIN = 1.2  # 20% buffer for all estimates
     CHUNK_OVERHEAD_TOKENS = 50  # Overhead per chunk when batched
+    WORD_TOKEN_RATIO = 1.3  # Subword tokens per whitespace-separated word (fast estimate)
+    FAST_ESTIMATE_TOLERANCE = 0.25  # Re-count exactly when within 25% of the budget
+    FAST_ESTIMATE_CHARS_PER_TOKEN = 4.0  # Character floor for text with few spaces (CJK, URLs)
 
     def __init__(
         self,
@@ -75,6 +81,7 @@ class ChunkBatcher:
         merge_threshold: float | None = None,
         tokenizer_type: str = "default",
         provider: str | None = None,
+        fast_estimate: bool = False,
     ) -> None:
         """
         Initialize batcher with context constraints and provider configuration.
@@ -88,8 +95,12 @@ class ChunkBatcher:
             tokenizer_type: Fallback tokenizer family (llama, gpt, small_model, etc.)
             provider: LLM provider name (openai, anthropic, google, etc.)
                      Used to apply provider-specific optimizations
+            fast_estimate: Estimate tokens from word counts instead of tokenizing
+                every chunk. Chunks that land near the batch limit are still
+                counted with the real tokenizer (default: False)
         """
         self.context_limit = context_limit
+        self.fast_estimate = fast_estimate
         self.system_prompt_tokens = system_prompt_tokens
         self.response_buffer_tokens = response_buffer_tokens
 
@@ -157,12 +168,13 @@ class ChunkBatcher:
         # Return default config if provider not found
         logger.warning(f"Provider '{provider}' not found in registry, using default configuration")
         # Create a minimal default config
+        from docling_graph.llm_clients.config import DEFAULT_TOKENIZER
         from docling_graph.llm_clients.config import ProviderConfig as LLMProviderConfig
 
         return LLMProviderConfig(
             provider_id="unknown",
             models={},
-            tokenizer="sentence-transformers/all-MiniLM-L6-v2",
+            tokenizer=DEFAULT_TOKENIZER,
             content_ratio=0.8,
             merge_threshold=0.85,
             rate_limit_rpm=None,
@@ -207,10 +219,66 @@ class ChunkBatcher:
         )
         return estimated
 
+    def _fast_estimate_tokens(self, text: str) -> int:
+        """
+        Cheap token estimate from whitespace-separated word count.
+
+        Word counts badly undercount text with few spaces (CJK, long URLs,
+        base64, tables), so the estimate never drops below a character-based one.
+
+        Args:
+            text: Text to estimate
+
+        Returns:
+            Estimated token count with subword ratio and safety margin applied
+        """
+        words = text.count(" ") + text.count("\n") + 1
+        tokens = max(words * self.WORD_TOKEN_RATIO, len(text) / self.FAST_ESTIMATE_CHARS_PER_TOKEN)
+        return int(tokens * self.SAFETY_MARGIN)
+
+    def _is_borderline(self, current_tokens: int, chunk_tokens: int) -> bool:
+        """Check whether adding chunk_tokens lands close enough to the budget to matter."""
+        margin = self.available_tokens * self.FAST_ESTIMATE_TOLERANCE
+        return abs(current_tokens + chunk_tokens - self.available_tokens) <= margin
+
+    def _estimate_tokens_batch(
+        self,
+        chunks: List[str],
+        tokenizer_fn: Callable[[str], int] | None = None,
+        batch_tokenizer_fn: Callable[[List[str]], List[int]] | None = None,
+    ) -> List[int]:
+        """
+        Estimate tokens for all chunks, preferring a single batched tokenizer call.
+
+        Args:
+            chunks: Texts to estimate
+            tokenizer_fn: Optional per-text tokenizer function
+            batch_tokenizer_fn: Optional function counting tokens for a list of texts
+
+        Returns:
+            Estimated token count per chunk with safety margin applied
+        """
+        if batch_tokenizer_fn:
+            try:
+                counts = batch_tokenizer_fn(chunks)
+                if len(counts) == len(chunks):
+                    return [int(tokens * self.SAFETY_MARGIN) for tokens in counts]
+                logger.warning(
+                    f"Batch tokenizer returned {len(counts)} counts for {len(chunks)} chunks. "
+                    f"Falling back to per-chunk estimation."
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Batch tokenizer function failed: {e}. Falling back to per-chunk estimation."
+                )
+
+        return [self._estimate_tokens(chunk, tokenizer_fn) for chunk in chunks]
+
     def batch_chunks(
         self,
         chunks: List[str],
         tokenizer_fn: Callable[[str], int] | None = None,
+        batch_tokenizer_fn: Callable[[List[str]], List[int]] | None = None,
     ) -> List[ChunkBatch]:
         """
         Batch chunks to fit context window efficiently.
@@ -224,6 +292,9 @@ class ChunkBatcher:
             chunks: List of chunk texts
             tokenizer_fn: Optional real tokenizer function from DocumentChunker
                          (e.g., self.doc_processor.chunker.tokenizer.count_tokens)
+            batch_tokenizer_fn: Optional batched variant counting all chunks in one call
+                         (e.g., self.doc_processor.chunker.count_tokens_batch).
+                         Takes priority over tokenizer_fn.
 
         Returns:
             List of ChunkBatch objects ready for LLM extraction
@@ -232,7 +303,7 @@ class ChunkBatcher:
             return []
 
         # Log tokenizer source
-        if tokenizer_fn:
+        if tokenizer_fn or batch_tokenizer_fn:
             rich_print("[blue][ChunkBatcher][/blue] Using real tokenizer from DocumentChunker")
         else:
             rich_print(
@@ -246,11 +317,23 @@ class ChunkBatcher:
         current_batch_indices: List[int] = []
         current_tokens = 0
 
-        for chunk_idx, chunk_text in enumerate(chunks):
-            # Estimate tokens for this chunk (with overhead)
-            chunk_tokens = (
-                self._estimate_tokens(chunk_text, tokenizer_fn) + self.CHUNK_OVERHEAD_TOKENS
-            )
+        # Estimate tokens for all chunks up front (one tokenizer call when batched)
+        if self.fast_estimate:
+            estimates = [self._fast_estimate_tokens(chunk) for chunk in chunks]
+        else:
+            estimates = self._estimate_tokens_batch(chunks, tokenizer_fn, batch_tokenizer_fn)
+
+        for chunk_idx, (chunk_text, estimate) in enumerate(zip(chunks, estimates, strict=True)):
+            # Token estimate for this chunk (with overhead)
+            chunk_tokens = estimate + self.CHUNK_OVERHEAD_TOKENS
+
+            # Fast estimates are only trusted when the packing decision is obvious
+            if self.fast_estimate and tokenizer_fn and self._is_borderline(
+                current_tokens, chunk_tokens
+            ):
+                chunk_tokens = (
+                    self._estimate_tokens(chunk_text, tokenizer_fn) + self.CHUNK_OVERHEAD_TOKENS
+                )
 
             # Check if adding this chunk exceeds available context
             potential_total = current_tokens + chunk_tokens
@@ -10,7 +10,10 @@ Preserves:
 Configurable per LLM provider tokenizer.
 """
 
-from typing import List, Optional, Union
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, List, Optional, Union
 
 from docling.chunking import HybridChunker
 from docling_core.transforms.chunker.tokenizer.huggingface import HuggingFaceTokenizer
@@ -20,14 +23,48 @@ from rich import print as rich_print
 from transformers import AutoTokenizer
 
 from ...llm_clients.config import (
+    DEFAULT_TOKENIZER,
     get_recommended_chunk_size,
     get_tokenizer_for_provider,
 )
 
+# Preferred break points for chunk_text_fallback, in priority order
+_BREAK_DELIMITERS = (". ", "! ", "? ", "\n\n", "\n")
+
+
+@lru_cache(maxsize=8)
+def _load_tokenizer(tokenizer_name: str) -> Any:
+    """Load a HuggingFace tokenizer once per process and reuse it across chunkers.
+
+    Requests the Rust-backed fast tokenizer; models without one fall back to the
+    (much slower) Python implementation, which is reported.
+    """
+    tokenizer = AutoTokenizer.from_pretrained(tokenizer_name, use_fast=True)
+    if not getattr(tokenizer, "is_fast", True):
+        rich_print(
+            f"[yellow][DocumentChunker][/yellow] No fast tokenizer available for "
+            f"[cyan]{tokenizer_name}[/cyan], token counting will be slower"
+        )
+    return tokenizer
+
 
 class DocumentChunker:
     """Structure-preserving document chunker using Docling's HybridChunker."""
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        "tokenizer",
+        "chunker",
+        "max_tokens",
+        "original_max_tokens",
+        "tokenizer_name",
+        "merge_peers",
+        "_token_count_cache",
+    )
+
+    # Max number of per-text token counts remembered (LRU) by count_tokens_batch
+    TOKEN_COUNT_CACHE_SIZE = 10_000
+
     def __init__(
         self,
         tokenizer_name: str | None = None,
@@ -55,7 +92,7 @@ class DocumentChunker:
             tokenizer_name = get_tokenizer_for_provider(provider)
 
         elif tokenizer_name is None:
-            tokenizer_name = "sentence-transformers/all-MiniLM-L6-v2"
+            tokenizer_name = DEFAULT_TOKENIZER
 
         # Step 2: Determine max_tokens (using centralized lookup with schema awareness)
         if max_tokens is None:
@@ -66,7 +103,7 @@ class DocumentChunker:
 
         # Step 3: Initialize tokenizer and chunker
         if tokenizer_name != "tiktoken":
-            hf_tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+            hf_tokenizer = _load_tokenizer(tokenizer_name)
             self.tokenizer = HuggingFaceTokenizer(
                 tokenizer=hf_tokenizer,
                 max_tokens=max_tokens,
@@ -86,9 +123,7 @@ class DocumentChunker:
                     "[yellow][DocumentChunker][/yellow] tiktoken not installed, "
                     "falling back to HuggingFace tokenizer"
                 )
-                hf_tokenizer = AutoTokenizer.from_pretrained(
-                    "sentence-transformers/all-MiniLM-L6-v2"
-                )
+                hf_tokenizer = _load_tokenizer(DEFAULT_TOKENIZER)
                 self.tokenizer = HuggingFaceTokenizer(
                     tokenizer=hf_tokenizer,
                     max_tokens=max_tokens,
@@ -104,6 +139,7 @@ class DocumentChunker:
         self.original_max_tokens = max_tokens  # Store original for schema adjustments
         self.tokenizer_name = tokenizer_name
         self.merge_peers = merge_peers
+        self._token_count_cache: OrderedDict[bytes, int] = OrderedDict()
 
         rich_print(
             f"[blue][DocumentChunker][/blue] Initialized with:\n"
@@ -235,29 +271,75 @@ class DocumentChunker:
             - max_tokens_in_chunk: maximum tokens in any chunk
             - total_tokens: sum of all chunk tokens
         """
-        chunks = []
-        chunk_tokens = []
-
-        chunk_iter = self.chunker.chunk(dl_doc=document)
-
-        for chunk in chunk_iter:
-            enriched_text = self.chunker.contextualize(chunk=chunk)
-            chunks.append(enriched_text)
+        chunks = self.chunk_document(document)
 
-            # Count tokens for this chunk
-            num_tokens = self.tokenizer.count_tokens(enriched_text)
-            chunk_tokens.append(num_tokens)
+        # Count tokens for all chunks in one batched tokenizer call
+        chunk_tokens = self.count_tokens_batch(chunks)
 
+        # Builtin sum()/max() already run as single C loops; just avoid summing twice
+        total_tokens = sum(chunk_tokens)
         stats = {
             "total_chunks": len(chunks),
             "chunk_tokens": chunk_tokens,
-            "avg_tokens": sum(chunk_tokens) / len(chunk_tokens) if chunk_tokens else 0,
-            "max_tokens_in_chunk": max(chunk_tokens) if chunk_tokens else 0,
-            "total_tokens": sum(chunk_tokens),
+            "avg_tokens": total_tokens / len(chunk_tokens) if chunk_tokens else 0,
+            "max_tokens_in_chunk": max(chunk_tokens, default=0),
+            "total_tokens": total_tokens,
         }
 
         return chunks, stats
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for many texts with a single batched tokenizer call.
+
+        HuggingFace fast tokenizers and tiktoken both encode a list of texts
+        in one native call, avoiding a Python round-trip per text. Falls back
+        to per-text counting for tokenizers without a batch API.
+
+        Counts are cached by content hash, so repeated boilerplate (headers,
+        footers, tables of contents) is only tokenized once.
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Token count per text, in input order
+        """
+        if not texts:
+            return []
+
+        cache = self._token_count_cache
+        keys = [hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest() for text in texts]
+
+        # Tokenize each distinct uncached text once
+        misses: dict[bytes, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in cache:
+                cache.move_to_end(key)
+            else:
+                misses.setdefault(key, text)
+
+        cache.update(zip(misses, self._count_tokens_uncached(list(misses.values())), strict=True))
+        result = [cache[key] for key in keys]
+        while len(cache) > self.TOKEN_COUNT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return result
+
+    def _count_tokens_uncached(self, texts: List[str]) -> List[int]:
+        """Count tokens for texts with one batched tokenizer call (no caching)."""
+        if not texts:
+            return []
+
+        backend = self.tokenizer.get_tokenizer()
+        try:
+            if self.tokenizer_name == "tiktoken" and hasattr(backend, "encode_batch"):
+                return [len(ids) for ids in backend.encode_batch(texts)]
+            encoded = backend(texts, add_special_tokens=False, return_length=True)
+            return [int(length) for length in encoded["length"]]
+        except Exception:
+            return [self.tokenizer.count_tokens(text) for text in texts]
+
     def chunk_text_fallback(self, text: str) -> List[str]:
         """
         Fallback chunker for raw text when DoclingDocument unavailable.
@@ -283,10 +365,10 @@ class DocumentChunker:
         while current_pos < len(text):
             end_pos = min(current_pos + max_chars, len(text))
 
-            # Try to break at sentence/semantic boundary
+            # Try to break at sentence/semantic boundary; rfind scans in C and
+            # jumps straight to the last delimiter in the window
             if end_pos < len(text):
-                # Priority order for breaking points
-                for delimiter in [". ", "! ", "? ", "\n\n", "\n"]:
+                for delimiter in _BREAK_DELIMITERS:
                     last_break = text.rfind(delimiter, current_pos, end_pos)
                     if last_break != -1:
                         end_pos = last_break + len(delimiter)
@@ -22,6 +22,9 @@ from .document_chunker import DocumentChunker
 class DocumentProcessor:
     """Handles document conversion to Markdown format and chunking."""
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ("docling_config", "chunker", "converter")
+
     def __init__(
         self,
         docling_config: str = "ocr",
@@ -27,6 +27,8 @@ class ExtractorFactory:
         docling_config: str = "ocr",
         use_chunking: bool = True,
         llm_consolidation: bool = False,
+        max_concurrent_pages: int = 1,
+        fast_token_estimate: bool = False,
     ) -> BaseExtractor:
         """
         Create an extractor based on configuration.
@@ -39,6 +41,10 @@ class ExtractorFactory:
             docling_config (str): Docling pipeline configuration ('default' or 'vlm')
             llm_consolidation (bool): Whether to use LLM consolidation.
             use_chunking (bool): Whether to use chunking.
+            max_concurrent_pages (int): Pages extracted at once by the LLM many-to-one
+                page-by-page fallback (default: 1, sequential).
+            fast_token_estimate (bool): Whether the LLM many-to-one strategy sizes chunk
+                batches from fast token estimates.
 
         Returns:
             BaseExtractor: Configured extractor instance.
@@ -55,40 +61,44 @@ class ExtractorFactory:
 
         # Create backend instance
         backend_obj: Backend
-        if backend_name == "vlm":
-            if not model_name:
-                raise ValueError("VLM requires model_name parameter")
-            backend_obj = VlmBackend(model_name=model_name)
-        elif backend_name == "llm":
-            if not llm_client:
-                raise ValueError("LLM requires llm_client parameter")
-            backend_obj = LlmBackend(llm_client=llm_client)
-        else:
-            raise ValueError(f"Unknown backend: {backend_name}")
+        match backend_name:
+            case "vlm":
+                if not model_name:
+                    raise ValueError("VLM requires model_name parameter")
+                backend_obj = VlmBackend(model_name=model_name)
+            case "llm":
+                if not llm_client:
+                    raise ValueError("LLM requires llm_client parameter")
+                backend_obj = LlmBackend(llm_client=llm_client)
+            case _:
+                raise ValueError(f"Unknown backend: {backend_name}")
 
         # Create strategy with docling_config
         extractor: BaseExtractor
 
-        if processing_mode == "one-to-one":
-            # OneToOneStrategy only takes backend and docling_config
-            # It doesn't use chunking or consolidation args
-            extractor = OneToOneStrategy(
-                backend=backend_obj,
-                docling_config=docling_config,
-            )
-        elif processing_mode == "many-to-one":
-            # Build args specifically for ManyToOne
-            strategy_args: dict[str, Any] = {
-                "backend": backend_obj,
-                "docling_config": docling_config,
-                "use_chunking": use_chunking,
-            }
-            if backend_name == "llm":
-                strategy_args["llm_consolidation"] = llm_consolidation
+        match processing_mode:
+            case "one-to-one":
+                # OneToOneStrategy only takes backend and docling_config
+                # It doesn't use chunking or consolidation args
+                extractor = OneToOneStrategy(
+                    backend=backend_obj,
+                    docling_config=docling_config,
+                )
+            case "many-to-one":
+                # Build args specifically for ManyToOne
+                strategy_args: dict[str, Any] = {
+                    "backend": backend_obj,
+                    "docling_config": docling_config,
+                    "use_chunking": use_chunking,
+                }
+                if backend_name == "llm":
+                    strategy_args["llm_consolidation"] = llm_consolidation
+                    strategy_args["max_concurrent_pages"] = max_concurrent_pages
+                    strategy_args["fast_token_estimate"] = fast_token_estimate
 
-            extractor = ManyToOneStrategy(**strategy_args)
-        else:
-            raise ValueError(f"Unknown processing_mode: {processing_mode}")
+                extractor = ManyToOneStrategy(**strategy_args)
+            case _:
+                raise ValueError(f"Unknown processing_mode: {processing_mode}")
 
         rich_print(
             f"[blue][ExtractorFactory][/blue] Created [green]{extractor.__class__.__name__}[/green]"
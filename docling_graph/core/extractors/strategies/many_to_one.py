@@ -3,7 +3,9 @@ Many-to-one extraction strategy.
 Processes entire document and returns single consolidated model.
 """
 
-from typing import List, Tuple, Type, cast
+import asyncio
+import inspect
+from typing import Any, Callable, List, Tuple, Type, cast
 
 from docling_core.types.doc import DoclingDocument
 from pydantic import BaseModel
@@ -37,6 +39,8 @@ class ManyToOneStrategy(BaseExtractor):
         use_chunking: bool = True,
         llm_consolidation: bool = False,
         chunker_config: dict | None = None,
+        max_concurrent_pages: int = 1,
+        fast_token_estimate: bool = False,
     ) -> None:
         """
         Initialize the extraction strategy with a backend and document processor.
@@ -53,11 +57,19 @@ class ManyToOneStrategy(BaseExtractor):
                     "merge_peers": True
                 }
                 If None and use_chunking=True, uses default tokenizer with backend's context limit.
+            max_concurrent_pages: Pages extracted at once in the page-by-page fallback
+                (default: 1, sequential). Values above 1 run the LLM client from worker
+                threads, so only raise it for thread-safe clients (not vLLM, whose
+                timeout relies on SIGALRM).
+            fast_token_estimate: Size chunk batches from word-count estimates, only
+                tokenizing chunks near the batch limit (default: False)
         """
         super().__init__()  # Initialize base extractor with trace_data attribute
         self.backend = backend
         self.llm_consolidation = llm_consolidation
         self.use_chunking = use_chunking
+        self.max_concurrent_pages = max(1, max_concurrent_pages)
+        self.fast_token_estimate = fast_token_estimate
 
         # Cache protocol checks (optimization: avoid repeated isinstance checks)
         self._is_llm = is_llm_backend(self.backend)
@@ -257,6 +269,7 @@ class ManyToOneStrategy(BaseExtractor):
 
             # Get tokenizer from chunker for accurate token counting
             tokenizer_fn = None
+            batch_tokenizer_fn = None
             if self.doc_processor.chunker and hasattr(self.doc_processor.chunker, "tokenizer"):
                 # Extract the count_tokens method from the tokenizer object
                 tokenizer_obj = self.doc_processor.chunker.tokenizer
@@ -265,6 +278,8 @@ class ManyToOneStrategy(BaseExtractor):
                     rich_print(
                         "[blue][ManyToOneStrategy][/blue] Using real tokenizer from DocumentChunker"
                     )
+                # Count all chunks in one tokenizer call when supported
+                batch_tokenizer_fn = getattr(self.doc_processor.chunker, "count_tokens_batch", None)
 
             # Create batcher
             batcher = ChunkBatcher(
@@ -272,10 +287,13 @@ class ManyToOneStrategy(BaseExtractor):
                 system_prompt_tokens=500,
                 response_buffer_tokens=500,
                 merge_threshold=0.85,
+                fast_estimate=self.fast_token_estimate,
             )
 
             # Batch chunks for efficient processing with real tokenizer
-            batches = batcher.batch_chunks(chunks, tokenizer_fn=tokenizer_fn)
+            batches = batcher.batch_chunks(
+                chunks, tokenizer_fn=tokenizer_fn, batch_tokenizer_fn=batch_tokenizer_fn
+            )
 
             rich_print(
                 f"[blue][ManyToOneStrategy][/blue] Starting batch extraction "
@@ -423,6 +441,79 @@ class ManyToOneStrategy(BaseExtractor):
             rich_print(f"[red]Traceback:[/red]\n{traceback.format_exc()}")
             return []
 
+    def _extract_page_models(
+        self,
+        backend: TextExtractionBackendProtocol,
+        page_markdowns: List[str],
+        template: Type[BaseModel],
+    ) -> List[BaseModel | None]:
+        """Extract one model (or None) per page, in page order.
+
+        Pages are extracted one by one unless ``max_concurrent_pages`` is above 1
+        and the backend exposes an ``extract_from_markdown_async`` coroutine.
+        """
+        total_pages = len(page_markdowns)
+        extract_async = getattr(backend, "extract_from_markdown_async", None)
+
+        if self.max_concurrent_pages > 1 and inspect.iscoroutinefunction(extract_async):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                rich_print(
+                    f"[blue][ManyToOneStrategy][/blue] Extracting {total_pages} pages "
+                    f"(up to {self.max_concurrent_pages} at a time)"
+                )
+                return asyncio.run(
+                    self._extract_pages_async(
+                        cast(Callable[..., Any], extract_async), page_markdowns, template
+                    )
+                )
+            # Already inside an event loop (e.g. a notebook): keep the sequential path
+
+        page_models: List[BaseModel | None] = []
+        for page_num, page_md in enumerate(page_markdowns, 1):
+            rich_print(
+                f"[blue][ManyToOneStrategy][/blue] Extracting from page {page_num}/{total_pages}"
+            )
+            page_models.append(
+                backend.extract_from_markdown(
+                    markdown=page_md,
+                    template=template,
+                    context=f"page {page_num}",
+                    is_partial=True,
+                )
+            )
+        return page_models
+
+    async def _extract_pages_async(
+        self,
+        extract_async: Callable[..., Any],
+        page_markdowns: List[str],
+        template: Type[BaseModel],
+    ) -> List[BaseModel | None]:
+        """Run page extractions concurrently, bounded by ``max_concurrent_pages``."""
+        semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+        total_pages = len(page_markdowns)
+
+        async def extract_page(page_num: int, page_md: str) -> BaseModel | None:
+            async with semaphore:
+                rich_print(
+                    f"[blue][ManyToOneStrategy][/blue] Extracting from page "
+                    f"{page_num}/{total_pages}"
+                )
+                return cast(
+                    BaseModel | None,
+                    await extract_async(
+                        markdown=page_md,
+                        template=template,
+                        context=f"page {page_num}",
+                        is_partial=True,
+                    ),
+                )
+
+        pages = enumerate(page_markdowns, 1)
+        return list(await asyncio.gather(*(extract_page(num, md) for num, md in pages)))
+
     # Page-by-page extraction + merging (LLM)
     def _extract_pages_and_merge(
         self,
@@ -440,19 +531,9 @@ class ManyToOneStrategy(BaseExtractor):
             )
 
             extracted_models: List[BaseModel] = []
+            page_models = self._extract_page_models(backend, page_markdowns, template)
 
-            for page_num, page_md in enumerate(page_markdowns, 1):
-                rich_print(
-                    f"[blue][ManyToOneStrategy][/blue] Extracting from page {page_num}/{total_pages}"
-                )
-
-                model = backend.extract_from_markdown(
-                    markdown=page_md,
-                    template=template,
-                    context=f"page {page_num}",
-                    is_partial=True,
-                )
-
+            for page_num, model in enumerate(page_models, 1):
                 if model:
                     extracted_models.append(model)
                 else:
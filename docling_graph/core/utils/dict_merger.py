@@ -3,8 +3,13 @@ Utility functions for document extraction.
 """
 
 import copy
+from functools import reduce
 from typing import Any, Dict, List
 
+from pydantic import BaseModel
+
+from .model_introspection import is_scalar_only_model
+
 
 def merge_pydantic_models(models: List[Any], template_class: type) -> Any:
     """
@@ -24,18 +29,19 @@ def merge_pydantic_models(models: List[Any], template_class: type) -> Any:
     if len(models) == 1:
         return models[0]
 
-    # Convert all models to dicts
-    dicts = [model.model_dump() for model in models]
+    # Start with first model as base (model_dump returns a fresh dict)
+    merged = models[0].model_dump()
 
-    # Start with first model as base
-    merged = copy.deepcopy(dicts[0])
+    # Merge remaining models one at a time
+    for model in models[1:]:
+        deep_merge_dicts(merged, model.model_dump())
 
-    # Merge remaining models
-    for d in dicts[1:]:
-        deep_merge_dicts(merged, d)
-
-    # Convert back to Pydantic model
+    # Convert back to Pydantic model. Dumped scalar values are already valid, so
+    # scalar-only templates can skip revalidation unless a custom serializer
+    # changed them; nested models must be validated back into model instances.
     try:
+        if is_scalar_only_model(template_class) and not _has_custom_serializers(template_class):
+            return template_class.model_construct(**merged)
         return template_class(**merged)
     except Exception as e:
         # If merge fails, return first model
@@ -43,6 +49,12 @@ def merge_pydantic_models(models: List[Any], template_class: type) -> Any:
         return models[0]
 
 
+def _has_custom_serializers(model_class: type[BaseModel]) -> bool:
+    """Check whether model_dump() output may differ from the stored field values."""
+    decorators = model_class.__pydantic_decorators__
+    return bool(decorators.field_serializers or decorators.model_serializers)
+
+
 def deep_merge_dicts(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
     """
     Recursively merge dicts with smart list deduplication.
@@ -71,9 +83,7 @@ def deep_merge_dicts(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str
                     target[key] = _merge_entity_lists(target_value, source_value)
                 else:
                     # Simple list: concatenate and deduplicate
-                    for item in source_value:
-                        if item not in target_value:
-                            target_value.append(item)
+                    _extend_unique(target_value, source_value)
 
             # Overwrite
             else:
@@ -82,6 +92,28 @@ def deep_merge_dicts(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str
     return target
 
 
+def _extend_unique(target_list: List[Any], source_list: List[Any]) -> None:
+    """
+    Append source items missing from target, in order, using a hash set.
+
+    Falls back to linear membership checks when items are unhashable.
+    """
+    try:
+        seen = set(target_list)
+        new_items = []
+        for item in source_list:
+            if item not in seen:
+                seen.add(item)
+                new_items.append(item)
+    except TypeError:
+        for item in source_list:
+            if item not in target_list:
+                target_list.append(item)
+        return
+
+    target_list.extend(new_items)
+
+
 def _merge_entity_lists(
     target_list: List[Dict],
     source_list: List[Dict],
@@ -134,11 +166,5 @@ def consolidate_extracted_data(data_list: List[Dict[str, Any]]) -> Dict[str, Any
     if len(data_list) == 1:
         return data_list[0]
 
-    # Start with first dict
-    consolidated = copy.deepcopy(data_list[0])
-
-    # Merge remaining dicts
-    for data in data_list[1:]:
-        deep_merge_dicts(consolidated, data)
-
-    return consolidated
+    # Merge remaining dicts in place into a copy of the first one
+    return reduce(deep_merge_dicts, data_list[1:], copy.deepcopy(data_list[0]))
@@ -8,7 +8,10 @@ Fixes common issues from batch-based extraction:
 - Inconsistent edges
 """
 
+import hashlib
+import json
 import logging
+from collections import defaultdict
 from typing import Any, Dict, List, Set, Tuple
 
 import networkx as nx
@@ -62,6 +65,25 @@ def is_meaningful_value(value: Any) -> bool:
     return True
 
 
+# Structural fields that do not count as node content
+METADATA_FIELDS = frozenset({"id", "label", "type"})
+
+
+def has_meaningful_data(node_data: Dict[str, Any]) -> bool:
+    """
+    Check if a node carries any meaningful value beyond its metadata fields.
+
+    Args:
+        node_data: Node attribute dictionary
+
+    Returns:
+        True if at least one non-metadata field has a meaningful value
+    """
+    return any(
+        is_meaningful_value(value) for key, value in node_data.items() if key not in METADATA_FIELDS
+    )
+
+
 class GraphCleaner:
     """
     Post-processing cleanup for graphs built from merged batch extractions.
@@ -90,6 +112,9 @@ class GraphCleaner:
             Cleaned graph (same object as input)
         """
         initial_nodes = graph.number_of_nodes()
+        if initial_nodes == 0:
+            return graph
+
         initial_edges = graph.number_of_edges()
 
         if self.verbose:
@@ -138,40 +163,24 @@ class GraphCleaner:
         A node is considered a phantom if it only has metadata fields
         (id, label, type) and no actual data fields with meaningful values.
         """
-        phantom_nodes = []
-
-        for node_id, node_data in graph.nodes(data=True):
-            # Check if node has any meaningful data beyond metadata
-            has_meaningful_data = False
-
-            for key, value in node_data.items():
-                # Skip metadata fields
-                if key in {"id", "label", "type"}:
-                    continue
-
-                # Check if this field has meaningful value
-                if is_meaningful_value(value):
-                    has_meaningful_data = True
-                    break
-
-            if not has_meaningful_data:
-                phantom_nodes.append(node_id)
-
-        # Remove phantoms and redirect edges
-        for phantom_id in phantom_nodes:
-            # Find edges pointing to this phantom
-            incoming = list(graph.in_edges(phantom_id, data=True))
-            outgoing = list(graph.out_edges(phantom_id, data=True))
-
-            # Remove the phantom
-            graph.remove_node(phantom_id)
-
-            if self.verbose and len(phantom_nodes) <= 5:
+        phantom_nodes = [
+            node_id
+            for node_id, node_data in graph.nodes(data=True)
+            if not has_meaningful_data(node_data)
+        ]
+
+        # Report a handful of phantoms while their edges are still attached
+        if self.verbose and len(phantom_nodes) <= 5:
+            for phantom_id in phantom_nodes:
                 rich_print(
                     f"[yellow][GraphCleaner][/yellow] Removed phantom: {phantom_id} "
-                    f"(had {len(incoming)} incoming, {len(outgoing)} outgoing edges)"
+                    f"(had {graph.in_degree(phantom_id)} incoming, "
+                    f"{graph.out_degree(phantom_id)} outgoing edges)"
                 )
 
+        # Removing a node also drops its incident edges
+        graph.remove_nodes_from(phantom_nodes)
+
         return len(phantom_nodes)
 
     def _deduplicate_nodes(self, graph: nx.DiGraph) -> int:
@@ -180,18 +189,18 @@ class GraphCleaner:
 
         Uses content-based hashing to identify semantic duplicates.
         """
-        # Group nodes by class and content hash
-        node_groups: Dict[str, List[str]] = {}
+        # Group nodes by content hash in a single pass (no pairwise comparison)
+        node_groups: Dict[str, List[str]] = defaultdict(list)
 
         for node_id, node_data in graph.nodes(data=True):
-            content_hash = self._compute_content_hash(node_data)
+            node_groups[self._compute_content_hash(node_data)].append(node_id)
 
-            if content_hash not in node_groups:
-                node_groups[content_hash] = []
-            node_groups[content_hash].append(node_id)
+        # Every node has distinct content: nothing to merge
+        if len(node_groups) == graph.number_of_nodes():
+            return 0
 
         # Merge duplicate groups
-        merged_count = 0
+        merged_nodes: List[str] = []
 
         for _content_hash, node_ids in node_groups.items():
             if len(node_ids) > 1:
@@ -199,66 +208,56 @@ class GraphCleaner:
                 canonical_id = node_ids[0]
                 duplicates = node_ids[1:]
 
+                # Redirect all edges from duplicates to canonical
                 for dup_id in duplicates:
-                    # Redirect all edges from duplicate to canonical
                     self._redirect_edges(graph, dup_id, canonical_id)
+                merged_nodes.extend(duplicates)
 
-                    # Remove duplicate
-                    graph.remove_node(dup_id)
-                    merged_count += 1
-
-                if self.verbose and merged_count <= 5:
+                if self.verbose and len(merged_nodes) <= 5:
                     rich_print(
                         f"[blue][GraphCleaner][/blue] Merged {len(duplicates)} duplicates "
                         f"into {canonical_id}"
                     )
 
-        return merged_count
+        # Edges left on duplicates now also exist on their canonical node
+        graph.remove_nodes_from(merged_nodes)
+
+        return len(merged_nodes)
 
     def _remove_orphaned_edges(self, graph: nx.DiGraph) -> int:
         """Remove edges that point to non-existent nodes."""
-        valid_nodes = set(graph.nodes())
-        orphaned_edges = []
-
-        for source, target in graph.edges():
-            if source not in valid_nodes or target not in valid_nodes:
-                orphaned_edges.append((source, target))
-
-        for source, target in orphaned_edges:
-            try:
-                graph.remove_edge(source, target)
-            except nx.NetworkXError as e:
-                # Log specific NetworkX errors (e.g., edge doesn't exist)
-                logger.warning(f"Could not remove orphaned edge {source} -> {target}: {e}")
-            except Exception as e:
-                # Log unexpected errors for debugging
-                logger.error(f"Unexpected error removing edge {source} -> {target}: {e}")
+        # The node view has O(1) membership, so no set copy of all nodes is needed
+        valid_nodes = graph.nodes
+        orphaned_edges = [
+            (source, target)
+            for source, target in graph.edges()
+            if source not in valid_nodes or target not in valid_nodes
+        ]
+
+        graph.remove_edges_from(orphaned_edges)
 
         return len(orphaned_edges)
 
     def _remove_duplicate_edges(self, graph: nx.DiGraph) -> int:
         """Remove duplicate edges (same source, target, and label)."""
+        # A DiGraph holds at most one edge per (source, target); only multigraphs
+        # can carry parallel duplicates
+        if not graph.is_multigraph():
+            return 0
+
         seen_edges: Set[Tuple[str, str, str]] = set()
         duplicate_edges = []
 
-        for source, target, edge_data in graph.edges(data=True):
-            label = edge_data.get("label", "")
+        for source, target, key, label in graph.edges(keys=True, data="label", default=""):
             edge_sig = (source, target, label)
 
             if edge_sig in seen_edges:
-                duplicate_edges.append((source, target))
+                duplicate_edges.append((source, target, key))
             else:
                 seen_edges.add(edge_sig)
 
-        for source, target in duplicate_edges:
-            # Keep only first occurrence
-            try:
-                edges = list(graph[source][target].keys())
-                if len(edges) > 1:
-                    for edge_key in edges[1:]:
-                        graph.remove_edge(source, target, edge_key)
-            except Exception:
-                pass
+        # Keep only first occurrence
+        graph.remove_edges_from(duplicate_edges)
 
         return len(duplicate_edges)
 
@@ -268,12 +267,9 @@ class GraphCleaner:
 
         Nodes with identical content (ignoring ID) get the same hash.
         """
-        import hashlib
-        import json
-
         # Extract content fields (exclude id, generated metadata)
         content_fields = {
-            k: v for k, v in node_data.items() if k not in {"id", "label", "type"} and v is not None
+            k: v for k, v in node_data.items() if k not in METADATA_FIELDS and v is not None
         }
 
         # Normalize and sort
@@ -293,15 +289,19 @@ class GraphCleaner:
 
         Preserves edge labels and attributes.
         """
-        # Redirect incoming edges
-        for source, _, edge_data in list(graph.in_edges(old_node, data=True)):
-            if source != new_node:  # Avoid self-loops
-                graph.add_edge(source, new_node, **edge_data)
+        # Snapshot both directions before adding anything (skip would-be self-loops)
+        redirected = [
+            (source, new_node, edge_data)
+            for source, _, edge_data in graph.in_edges(old_node, data=True)
+            if source != new_node
+        ]
+        redirected.extend(
+            (new_node, target, edge_data)
+            for _, target, edge_data in graph.out_edges(old_node, data=True)
+            if target != new_node
+        )
 
-        # Redirect outgoing edges
-        for _, target, edge_data in list(graph.out_edges(old_node, data=True)):
-            if target != new_node:  # Avoid self-loops
-                graph.add_edge(new_node, target, **edge_data)
+        graph.add_edges_from(redirected)
 
 
 def validate_graph_structure(graph: nx.DiGraph, raise_on_error: bool = True) -> bool:
@@ -323,7 +323,7 @@ def validate_graph_structure(graph: nx.DiGraph, raise_on_error: bool = True) ->
     issues = []
 
     # Check 1: All edge endpoints exist
-    valid_nodes = set(graph.nodes())
+    valid_nodes = graph.nodes
     for source, target in graph.edges():
         if source not in valid_nodes:
             issues.append(f"Edge source not in graph: {source}")
@@ -332,10 +332,7 @@ def validate_graph_structure(graph: nx.DiGraph, raise_on_error: bool = True) ->
 
     # Check 2: No empty nodes
     for node_id, node_data in graph.nodes(data=True):
-        has_meaningful_data = any(
-            is_meaningful_value(v) for k, v in node_data.items() if k not in {"id", "label", "type"}
-        )
-        if not has_meaningful_data:
+        if not has_meaningful_data(node_data):
             issues.append(f"Empty node: {node_id}")
 
     # Check 3: Count nodes/edges
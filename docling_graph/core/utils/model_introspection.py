@@ -0,0 +1,67 @@
+"""
+Introspection helpers for Pydantic model classes.
+"""
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Annotated, Any, Literal, get_args, get_origin
+from uuid import UUID
+
+from pydantic import BaseModel
+
+# Leaf types whose values can never be (or contain) a Pydantic model
+_SCALAR_LEAF_TYPES: tuple[type, ...] = (
+    str,
+    int,
+    float,
+    bool,
+    bytes,
+    type(None),
+    date,
+    datetime,
+    time,
+    timedelta,
+    Decimal,
+    UUID,
+    Enum,
+)
+
+
+def _annotation_may_hold_model(annotation: Any) -> bool:
+    """
+    Return True if values of ``annotation`` could be (or contain) Pydantic models.
+
+    Only known scalar leaf types count as model-free; anything else, including
+    bare containers such as ``list`` or ``dict``, is treated as possibly holding
+    a model.
+    """
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return False
+    if origin is Annotated:
+        return _annotation_may_hold_model(get_args(annotation)[0])
+    if origin is not None:
+        args = get_args(annotation)
+        # Unparameterized containers (``list``, ``List``) may hold anything
+        if not args:
+            return True
+        return any(_annotation_may_hold_model(arg) for arg in args if arg is not Ellipsis)
+    if isinstance(annotation, type):
+        return not issubclass(annotation, _SCALAR_LEAF_TYPES)
+    return True
+
+
+@lru_cache(maxsize=None)
+def is_scalar_only_model(model_class: type[BaseModel]) -> bool:
+    """
+    Check whether a model class can only hold scalar (non-model) field values.
+
+    Such models never produce edges or nested nodes, so callers can handle their
+    field values as plain data. The result is computed once per class.
+    """
+    return not any(
+        _annotation_may_hold_model(field_info.annotation)
+        for field_info in model_class.model_fields.values()
+    )
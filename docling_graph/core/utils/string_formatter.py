@@ -5,6 +5,9 @@ import re
 from datetime import date, datetime
 from typing import Any
 
+# Compiled once; format_property_key runs for every property in a report
+_CAMEL_CASE_RE = re.compile(r"([A-Z])")
+
 
 def format_property_value(value: Any, max_length: int = 80) -> str:
     """
@@ -44,7 +47,7 @@ def format_property_key(key: str) -> str:
         return " ".join(word.capitalize() for word in key.split("_"))
 
     # Handle camelCase
-    return re.sub(r"([A-Z])", r" \1", key).strip().title()
+    return _CAMEL_CASE_RE.sub(r" \1", key).strip().title()
 
 
 def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
@@ -61,15 +64,16 @@ def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
     Raises:
         ValueError: If max_length is less than suffix length.
     """
-    if len(suffix) >= max_length:
+    suffix_len = len(suffix)
+    if suffix_len >= max_length:
         raise ValueError(
-            f"max_length ({max_length}) must be greater than suffix length ({len(suffix)})"
+            f"max_length ({max_length}) must be greater than suffix length ({suffix_len})"
         )
 
     if len(text) <= max_length:
         return text
 
-    return text[: max_length - len(suffix)] + suffix
+    return text[: max_length - suffix_len] + suffix
 
 
 def json_serializable(obj: Any) -> Any:
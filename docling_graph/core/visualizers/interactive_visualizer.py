@@ -7,6 +7,7 @@ import os
 import webbrowser
 from collections import Counter
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Tuple
 
@@ -17,6 +18,16 @@ from rich import print as rich_print
 
 from ..utils.string_formatter import DateTimeEncoder
 
+TEMPLATE_PATH = Path(__file__).parent / "assets/interactive_template.html"
+
+
+@lru_cache(maxsize=1)
+def _load_template() -> str | None:
+    """Read the packaged HTML template once; None if it is missing."""
+    if not TEMPLATE_PATH.exists():
+        return None
+    return TEMPLATE_PATH.read_text(encoding="utf-8")
+
 
 class InteractiveVisualizer:
     """Visualize graphs using Cytoscape in the browser."""
@@ -268,13 +279,10 @@ class InteractiveVisualizer:
         """
         Export Cytoscape visualization to a standalone HTML file.
         """
-        # Read the template
-        template_path = Path(__file__).parent / "assets/interactive_template.html"
+        # Read the template (cached across calls)
+        html_template = _load_template()
 
-        if template_path.exists():
-            with open(template_path, encoding="utf-8") as f:
-                html_template = f.read()
-        else:
+        if html_template is None:
             # Fallback: use inline template (minimal version)
             rich_print(
                 "[yellow][InteractiveVisualizer][/yellow] HTML template missing - Falling back to minimal version instead"
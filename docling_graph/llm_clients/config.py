@@ -16,6 +16,9 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Tokenizer used when neither the caller nor the provider specifies one
+DEFAULT_TOKENIZER = "sentence-transformers/all-MiniLM-L6-v2"
+
 
 class ModelCapability(Enum):
     """Model capability tiers for adaptive extraction strategies."""
@@ -219,7 +222,7 @@ class ConfigRegistry:
             self._providers[provider_id] = ProviderConfig(
                 provider_id=provider_id,
                 models=models,
-                tokenizer=provider_data.get("tokenizer", "sentence-transformers/all-MiniLM-L6-v2"),
+                tokenizer=provider_data.get("tokenizer", DEFAULT_TOKENIZER),
                 content_ratio=provider_data.get("content_ratio", 0.8),
                 merge_threshold=provider_data.get("merge_threshold", 0.85),
                 rate_limit_rpm=provider_data.get("rate_limit_rpm"),
@@ -346,7 +349,7 @@ def get_tokenizer_for_provider(provider: str) -> str:
     provider_config = get_provider_config(provider)
     if provider_config:
         return provider_config.tokenizer
-    return "sentence-transformers/all-MiniLM-L6-v2"  # Default fallback
+    return DEFAULT_TOKENIZER  # Default fallback
 
 
 def get_recommended_chunk_size(provider: str, model: str, schema_size: int = 0) -> int:
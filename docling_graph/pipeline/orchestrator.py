@@ -197,6 +197,8 @@ class PipelineOrchestrator:
                             "use_chunking": self.config.use_chunking,
                             "llm_consolidation": self.config.llm_consolidation,
                             "max_batch_size": self.config.max_batch_size,
+                            "max_concurrent_pages": self.config.max_concurrent_pages,
+                            "fast_token_estimate": self.config.fast_token_estimate,
                         },
                     },
                     "processing_time_seconds": round(pipeline_processing_time, 2),
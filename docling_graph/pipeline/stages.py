@@ -495,6 +495,8 @@ class ExtractionStage(PipelineStage):
                 docling_config=conf["docling_config"],
                 llm_consolidation=conf.get("llm_consolidation", True),
                 use_chunking=conf.get("use_chunking", True),
+                max_concurrent_pages=conf.get("max_concurrent_pages", 1),
+                fast_token_estimate=conf.get("fast_token_estimate", False),
             )
 
     @staticmethod
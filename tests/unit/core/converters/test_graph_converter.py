@@ -137,3 +137,70 @@ def test_conversion_without_cleanup():
     # Should have 2 nodes and 1 edge
     assert graph.number_of_nodes() == 2
     assert graph.number_of_edges() == 1
+
+
+def test_shared_instance_fingerprinted_once(converter):
+    """Test that an instance referenced several times is only fingerprinted once per pass."""
+    company = Company(name="Shared Inc.", location="NY")
+    alice = Person(name="Alice", works_for=company)
+    bob = Person(name="Bob", works_for=company)
+    carol = Person(name="Carol", works_for=company, friends=[alice, bob])
+
+    with patch.object(
+        converter.registry,
+        "_generate_fingerprint",
+        wraps=converter.registry._generate_fingerprint,
+    ) as spy:
+        graph, _ = converter.pydantic_list_to_graph([alice, bob, carol])
+
+    # 3 from register_batch + one per distinct instance (4) during conversion
+    assert spy.call_count == 7
+    assert graph.number_of_nodes() == 4
+    assert graph.number_of_edges() == 5
+
+
+def test_is_scalar_only_model():
+    """Test detection of models whose fields can never hold nested models."""
+    from docling_graph.core.utils.model_introspection import is_scalar_only_model
+
+    assert is_scalar_only_model(SimpleModel)
+    assert is_scalar_only_model(Company)
+    assert not is_scalar_only_model(Person)
+
+
+class Team(BaseModel):
+    name: str
+    members: list = []
+
+    model_config = {"graph_id_fields": ["name"]}
+
+
+def test_is_scalar_only_model_bare_container():
+    """Test that unparameterized containers are not treated as scalar-only."""
+    from docling_graph.core.utils.model_introspection import is_scalar_only_model
+
+    assert not is_scalar_only_model(Team)
+
+
+def test_bare_list_field_keeps_nested_models():
+    """Test that models held in a bare ``list`` field still become nodes and edges."""
+    converter = GraphConverter(auto_cleanup=False, validate_graph=False)
+    team = Team(name="Core", members=[Person(name="Alice"), Person(name="Bob")])
+
+    graph, _ = converter.pydantic_list_to_graph([team])
+
+    assert graph.number_of_nodes() == 3
+    assert graph.number_of_edges() == 2
+
+
+def test_scalar_only_model_node_attributes():
+    """Test that scalar-only models keep all field values as node attributes."""
+    converter = GraphConverter(auto_cleanup=False, validate_graph=False)
+    model = SimpleModel(name="Test", age=25)
+
+    graph, _ = converter.pydantic_list_to_graph([model])
+
+    ((_, data),) = graph.nodes(data=True)
+    assert data["label"] == "SimpleModel"
+    assert data["name"] == "Test"
+    assert data["age"] == 25
@@ -169,8 +169,8 @@ class TestCypherExporterExport:
 
         exporter.export(sample_graph, output_file)
 
-        content = output_file.read_text()
-        assert "// Cypher script generated" in content
+        content = output_file.read_bytes()
+        assert b"// Cypher script generated" in content
 
     def test_export_contains_create_nodes(self, sample_graph, tmp_path):
         """Exported file should contain CREATE NODE statements."""
@@ -179,9 +179,9 @@ class TestCypherExporterExport:
 
         exporter.export(sample_graph, output_file)
 
-        content = output_file.read_text()
-        assert "CREATE" in content
-        assert "Person" in content or "Company" in content
+        content = output_file.read_bytes()
+        assert b"CREATE" in content
+        assert b"Person" in content or b"Company" in content
 
     def test_export_contains_create_relationships(self, sample_graph, tmp_path):
         """Exported file should contain relationship creation."""
@@ -190,9 +190,9 @@ class TestCypherExporterExport:
 
         exporter.export(sample_graph, output_file)
 
-        content = output_file.read_text()
-        assert "CREATE" in content
-        assert "->" in content
+        content = output_file.read_bytes()
+        assert b"CREATE" in content
+        assert b"->" in content
 
     def test_export_is_valid_cypher_syntax(self, sample_graph, tmp_path):
         """Exported content should look like valid Cypher."""
@@ -201,8 +201,8 @@ class TestCypherExporterExport:
 
         exporter.export(sample_graph, output_file)
 
-        content = output_file.read_text()
+        content = output_file.read_bytes()
         # Check for basic Cypher syntax elements
-        assert "CREATE" in content
-        assert ":" in content  # Labels
-        assert "->" in content or "<-" in content  # Relationships
+        assert b"CREATE" in content
+        assert b":" in content  # Labels
+        assert b"->" in content or b"<-" in content  # Relationships
@@ -3,18 +3,40 @@ Tests for JSON exporter.
 """
 
 import json
+import re
+from contextlib import nullcontext
+from datetime import date
+from enum import Enum
 from pathlib import Path
+from typing import Any, ContextManager
+from unittest.mock import patch
+from uuid import UUID
 
 import networkx as nx
 import pytest
 
 from docling_graph.core.converters.config import ExportConfig
 from docling_graph.core.exporters.json_exporter import JSONExporter
+from docling_graph.core.utils.string_formatter import json_serializable
 
 
-@pytest.fixture
+# nx.config is usable as a context manager from networkx 3.3 onwards
+NX_VERSION = tuple(int(part) for part in re.findall(r"\d+", nx.__version__)[:2])
+NX_CONFIG_CONTEXT = NX_VERSION >= (3, 3)
+
+
+class Color(Enum):
+    RED = "red"
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON file back with a single read."""
+    return json.loads(path.read_bytes())
+
+
+@pytest.fixture(scope="module")
 def sample_graph():
-    """Create a sample graph."""
+    """Create a sample graph (read-only, shared across the module)."""
     graph = nx.DiGraph()
     graph.add_node("n1", label="Person", name="John")
     graph.add_node("n2", label="Company", name="ACME")
@@ -22,12 +44,30 @@ def sample_graph():
     return graph
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def large_graph():
+    """Create a large random graph (~100k edges) for scaling checks."""
+    return nx.fast_gnp_random_graph(10_000, 0.001, seed=42, directed=True)
+
+
+@pytest.fixture(scope="module")
 def empty_graph():
-    """Create an empty graph."""
+    """Create an empty graph (read-only, shared across the module)."""
     return nx.DiGraph()
 
 
+@pytest.fixture(scope="module")
+def base_tmp(tmp_path_factory):
+    """Create one temp directory shared by every export test in the module."""
+    return tmp_path_factory.mktemp("json_exp")
+
+
+@pytest.fixture
+def output_file(base_tmp, request):
+    """Unique output path per test inside the shared module directory."""
+    return base_tmp / f"graph_{request.node.name}.json"
+
+
 class TestJSONExporterInitialization:
     """Test JSONExporter initialization."""
 
@@ -110,91 +150,81 @@ class TestJSONExporterGraphToDict:
 class TestJSONExporterExport:
     """Test JSON export functionality."""
 
-    def test_export_creates_file(self, sample_graph, tmp_path):
+    def test_export_creates_file(self, sample_graph, output_file):
         """Should create JSON file."""
         exporter = JSONExporter()
-        output_file = tmp_path / "graph.json"
 
         exporter.export(sample_graph, output_file)
 
         assert output_file.exists()
         assert output_file.suffix == ".json"
 
-    def test_export_empty_graph_raises_error(self, empty_graph, tmp_path):
+    def test_export_empty_graph_raises_error(self, empty_graph, output_file):
         """Should raise error for empty graph."""
         exporter = JSONExporter()
 
         with pytest.raises(ValueError):
-            exporter.export(empty_graph, tmp_path / "output.json")
+            exporter.export(empty_graph, output_file)
 
-    def test_export_creates_parent_directories(self, sample_graph, tmp_path):
+    def test_export_creates_parent_directories(self, sample_graph, output_file):
         """Should create parent directories if needed."""
         exporter = JSONExporter()
-        output_file = tmp_path / "nested" / "deep" / "graph.json"
+        output_file = output_file.with_suffix("") / "nested" / "deep" / "graph.json"
 
         exporter.export(sample_graph, output_file)
 
         assert output_file.exists()
 
-    def test_export_creates_valid_json(self, sample_graph, tmp_path):
+    def test_export_creates_valid_json(self, sample_graph, output_file):
         """Exported file should be valid JSON."""
         exporter = JSONExporter()
-        output_file = tmp_path / "graph.json"
 
         exporter.export(sample_graph, output_file)
 
-        with open(output_file) as f:
-            data = json.load(f)
+        data = read_json(output_file)
 
         assert "nodes" in data
         assert "edges" in data
 
-    def test_export_preserves_node_data(self, sample_graph, tmp_path):
+    def test_export_preserves_node_data(self, sample_graph, output_file):
         """Export should preserve node attributes."""
         exporter = JSONExporter()
-        output_file = tmp_path / "graph.json"
 
         exporter.export(sample_graph, output_file)
 
-        with open(output_file) as f:
-            data = json.load(f)
+        data = read_json(output_file)
 
         nodes = data["nodes"]
         assert len(nodes) == 2
         assert any(n["name"] == "John" for n in nodes)
 
-    def test_export_preserves_edge_data(self, sample_graph, tmp_path):
+    def test_export_preserves_edge_data(self, sample_graph, output_file):
         """Export should preserve edge attributes."""
         exporter = JSONExporter()
-        output_file = tmp_path / "graph.json"
 
         exporter.export(sample_graph, output_file)
 
-        with open(output_file) as f:
-            data = json.load(f)
+        data = read_json(output_file)
 
         edges = data["edges"]
         assert len(edges) == 1
         assert edges[0]["strength"] == 0.9
 
-    def test_export_uses_configured_encoding(self, sample_graph, tmp_path):
+    def test_export_uses_configured_encoding(self, sample_graph, output_file):
         """Should use configured encoding."""
         config = ExportConfig()
         exporter = JSONExporter(config=config)
-        output_file = tmp_path / "graph.json"
 
         exporter.export(sample_graph, output_file)
 
-        # Verify encoding by reading file
-        with open(output_file, encoding=config.JSON_ENCODING) as f:
-            data = json.load(f)
+        # Verify encoding by decoding the raw bytes
+        data = json.loads(output_file.read_bytes().decode(config.JSON_ENCODING))
         assert data is not None
 
-    def test_export_uses_configured_indent(self, sample_graph, tmp_path):
+    def test_export_uses_configured_indent(self, sample_graph, output_file):
         """Should use configured indentation."""
         config = ExportConfig()
         exporter = JSONExporter(config=config)
-        output_file = tmp_path / "graph.json"
 
         exporter.export(sample_graph, output_file)
 
@@ -202,3 +232,124 @@ class TestJSONExporterExport:
         # Indented JSON should have newlines and spaces
         assert "\n" in content
         assert "  " in content
+
+    def test_export_streamed_output_matches_stdlib(self, sample_graph, output_file):
+        """Streamed output should match a one-shot stdlib dump byte for byte."""
+        exporter = JSONExporter()
+
+        exporter.export(sample_graph, output_file)
+
+        expected = json.dumps(JSONExporter._graph_to_dict(sample_graph), indent=2)
+        assert output_file.read_bytes() == expected.encode("utf-8")
+
+    def test_export_streamed_output_matches_stdlib_without_edges(self, output_file):
+        """Streamed output should match a one-shot dump, including empty sections."""
+        graph = nx.DiGraph()
+        graph.add_node("n1", label="Person", tags=["a", "b"], address={"city": "Paris"})
+        exporter = JSONExporter(config=ExportConfig(JSON_INDENT=4))
+
+        exporter.export(graph, output_file)
+
+        expected = json.dumps(JSONExporter._graph_to_dict(graph), indent=4)
+        assert output_file.read_bytes() == expected.encode("utf-8")
+
+    def test_export_compact_writes_once(self, sample_graph, output_file):
+        """Compact output should be serialized in memory, not streamed through json.dump."""
+        exporter = JSONExporter(config=ExportConfig(JSON_INDENT=None))  # type: ignore[arg-type]
+
+        with patch(
+            "docling_graph.core.exporters.json_exporter.json.dump", side_effect=AssertionError
+        ):
+            exporter.export(sample_graph, output_file)
+
+        expected = json.dumps(JSONExporter._graph_to_dict(sample_graph))
+        assert output_file.read_bytes() == expected.encode("utf-8")
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            ExportConfig(),
+            ExportConfig(JSON_INDENT=None),  # type: ignore[arg-type]
+            ExportConfig(JSON_INDENT=0),
+            ExportConfig(JSON_INDENT=4),
+            ExportConfig(ENSURE_ASCII=True),
+            ExportConfig(JSON_ENCODING="latin-1"),
+            ExportConfig(JSON_ENCODING="utf-16", JSON_INDENT=4),
+        ],
+        ids=["default", "indent-none", "indent-0", "indent-4", "ascii", "latin-1", "utf-16"],
+    )
+    def test_export_matches_stdlib_dump(self, config, output_file):
+        """Exported bytes should equal json.dumps output for every supported config."""
+        graph = nx.DiGraph()
+        graph.add_node("n1", label="Personne", name="Zoé", tags=["née", "café"])
+        graph.add_node("n2", label="Société", name="Crème", address={"ville": "Besançon"})
+        graph.add_node("n3", label="Mesure", ratio=1e-7, scale=1e16, relevé=date(2020, 1, 2))
+        graph.add_edge("n1", "n2", label="travaille_pour", since=2020)
+
+        JSONExporter(config=config).export(graph, output_file)
+
+        expected = json.dumps(
+            JSONExporter._graph_to_dict(graph),
+            indent=config.JSON_INDENT,
+            ensure_ascii=config.ENSURE_ASCII,
+            default=json_serializable,
+        )
+        assert output_file.read_bytes() == expected.encode(config.JSON_ENCODING)
+
+    @pytest.mark.parametrize("indent", [2, None], ids=["streamed", "compact"])
+    @pytest.mark.parametrize("value", [Color.RED, UUID(int=1)], ids=["enum", "uuid"])
+    def test_export_rejects_values_stdlib_rejects(self, indent, value, output_file):
+        """Values json.dumps cannot encode should fail the same way on both export paths."""
+        graph = nx.DiGraph()
+        graph.add_node("n1", label="Item", value=value)
+        exporter = JSONExporter(config=ExportConfig(JSON_INDENT=indent))  # type: ignore[arg-type]
+
+        with pytest.raises(TypeError, match="not serializable"):
+            exporter.export(graph, output_file)
+
+    def test_export_non_finite_floats_match_stdlib(self, output_file):
+        """NaN and infinities should be written the way stdlib json writes them."""
+        graph = nx.DiGraph()
+        graph.add_node("n1", label="Metric", score=float("nan"), bounds=[float("-inf"), 1.5])
+        graph.add_node("n2", label="Metric", score=0.5)
+        graph.add_edge("n1", "n2", label="next", weight=float("inf"))
+
+        JSONExporter().export(graph, output_file)
+
+        expected = json.dumps(JSONExporter._graph_to_dict(graph), indent=2)
+        assert output_file.read_bytes() == expected.encode("utf-8")
+
+
+class TestJSONExporterLargeGraph:
+    """Test JSON export on large graphs, optionally with a GPU networkx backend."""
+
+    @pytest.mark.parametrize(
+        "backend",
+        [
+            "networkx",
+            pytest.param(
+                "cugraph",
+                marks=[
+                    pytest.mark.gpu,
+                    pytest.mark.skipif(
+                        not NX_CONFIG_CONTEXT, reason="requires networkx>=3.3 for nx.config"
+                    ),
+                ],
+            ),
+        ],
+    )
+    def test_export_large_graph(self, large_graph, output_file, backend):
+        """Large graphs should export completely under each networkx backend."""
+        backend_context: ContextManager[Any] = nullcontext()
+        if backend == "cugraph":
+            pytest.importorskip("nx_cugraph")
+            backend_context = nx.config(backend_priority=[backend])
+        exporter = JSONExporter()
+
+        with backend_context:
+            exporter.export(large_graph, output_file)
+
+        data = read_json(output_file)
+        assert data["metadata"]["node_count"] == large_graph.number_of_nodes()
+        assert data["metadata"]["edge_count"] == large_graph.number_of_edges()
+        assert len(data["edges"]) == large_graph.number_of_edges()
@@ -1,11 +1,10 @@
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 from docling_graph.core.extractors.backends.llm_backend import LlmBackend
-from docling_graph.llm_clients.base import BaseLlmClient
 
 
 # A simple Pydantic model for testing
@@ -13,14 +12,29 @@ class MockTemplate(BaseModel):
     name: str
     age: int
 
+    model_config = ConfigDict(frozen=True)
+
+
+# Schema generation is comparatively slow; build it once for the module
+MOCK_SCHEMA_JSON = json.dumps(MockTemplate.model_json_schema(), indent=2)
+
+
+class StubLlmClient:
+    """Lightweight stand-in for BaseLlmClient.
+
+    Avoids MagicMock(spec=...) class introspection; only get_json_response
+    is a Mock so tests can set return values and inspect calls.
+    """
+
+    def __init__(self, context_limit: int = 8000) -> None:
+        self.context_limit = context_limit
+        self.get_json_response = Mock(return_value=None)
+
 
 # Fixture for a mock LLM client
 @pytest.fixture
 def mock_llm_client():
-    client = MagicMock(spec=BaseLlmClient)
-    client.__class__.__name__ = "MockLlmClient"
-    client.context_limit = 8000  # Set as integer, not MagicMock
-    return client
+    return StubLlmClient()
 
 
 # Fixture for the LlmBackend
@@ -40,7 +54,6 @@ def test_extract_from_markdown_success(mock_get_prompt, llm_backend, mock_llm_cl
     markdown = "This is a test."
     context = "test context"
     expected_json = {"name": "Test", "age": 30}
-    schema_json = json.dumps(MockTemplate.model_json_schema(), indent=2)
 
     # Configure mock client
     mock_llm_client.get_json_response.return_value = expected_json
@@ -59,11 +72,11 @@ def test_extract_from_markdown_success(mock_get_prompt, llm_backend, mock_llm_cl
     mock_get_prompt.assert_called_once()
     call_kwargs = mock_get_prompt.call_args[1]
     assert call_kwargs["markdown_content"] == markdown
-    assert call_kwargs["schema_json"] == schema_json
+    assert call_kwargs["schema_json"] == MOCK_SCHEMA_JSON
     assert not call_kwargs["is_partial"]
     assert "model_config" in call_kwargs  # New parameter
     mock_llm_client.get_json_response.assert_called_with(
-        prompt={"system": "sys", "user": "user"}, schema_json=schema_json
+        prompt={"system": "sys", "user": "user"}, schema_json=MOCK_SCHEMA_JSON
     )
 
 
@@ -84,6 +97,19 @@ def test_extract_from_markdown_no_json_returned(llm_backend, mock_llm_client):
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_extract_from_markdown_async_delegates(llm_backend, mock_llm_client):
+    """Test that the async variant runs the sync extraction and returns its result."""
+    mock_llm_client.get_json_response.return_value = {"name": "Test", "age": 30}
+
+    result = await llm_backend.extract_from_markdown_async(
+        markdown="Some content", template=MockTemplate, context="page 1", is_partial=True
+    )
+
+    assert result == MockTemplate(name="Test", age=30)
+    mock_llm_client.get_json_response.assert_called_once()
+
+
 @patch("docling_graph.core.extractors.backends.llm_backend.rich_print")
 def test_extract_from_markdown_validation_error(mock_rich_print, llm_backend, mock_llm_client):
     """Test when the LLM returns JSON that fails Pydantic validation."""
@@ -104,8 +130,8 @@ def test_extract_from_markdown_validation_error(mock_rich_print, llm_backend, mo
 @patch("docling_graph.core.extractors.backends.llm_backend.get_consolidation_prompt")
 def test_consolidate_success(mock_get_prompt, llm_backend, mock_llm_client):
     """Test successful consolidation."""
-    raw_models = [MockTemplate(name="Test", age=30)]
-    programmatic_model = MockTemplate(name="Test", age=30)
+    raw_models = [MockTemplate.model_construct(name="Test", age=30)]
+    programmatic_model = MockTemplate.model_construct(name="Test", age=30)
     expected_json = {"name": "Consolidated", "age": 31}
 
     mock_llm_client.get_json_response.return_value = expected_json
@@ -125,8 +151,8 @@ def test_consolidate_success(mock_get_prompt, llm_backend, mock_llm_client):
 @patch("docling_graph.core.extractors.backends.llm_backend.rich_print")
 def test_consolidate_validation_error(mock_rich_print, llm_backend, mock_llm_client):
     """Test consolidation with a Pydantic validation error."""
-    raw_models = [MockTemplate(name="Test", age=30)]
-    programmatic_model = MockTemplate(name="Test", age=30)
+    raw_models = [MockTemplate.model_construct(name="Test", age=30)]
+    programmatic_model = MockTemplate.model_construct(name="Test", age=30)
     # 'age' is missing
     invalid_json = {"name": "Consolidated"}
 
@@ -146,7 +172,7 @@ def test_consolidate_validation_error(mock_rich_print, llm_backend, mock_llm_cli
 
 @patch("gc.collect")
 def test_cleanup(mock_gc_collect, mock_llm_client):
-    """Test that cleanup removes the client and calls garbage collection."""
+    """Test that cleanup removes the client without forcing garbage collection."""
     # Add a mock cleanup method to the client
     mock_llm_client.cleanup = MagicMock()
 
@@ -159,8 +185,8 @@ def test_cleanup(mock_gc_collect, mock_llm_client):
     mock_llm_client.cleanup.assert_called_once()
     # Check client attribute was deleted
     assert not hasattr(backend, "client")
-    # Check gc was called
-    mock_gc_collect.assert_called_once()
+    # Check no full collection was forced
+    mock_gc_collect.assert_not_called()
 
 
 # --- Tests for Phase 1 Fix 5: Model-Aware Backend ---
@@ -233,8 +259,11 @@ def test_consolidate_chain_of_density(mock_get_prompt, llm_backend, mock_llm_cli
         model_id="gpt-4", context_limit=128000, capability=ModelCapability.ADVANCED
     )
 
-    raw_models = [MockTemplate(name="Test1", age=30), MockTemplate(name="Test2", age=31)]
-    programmatic_model = MockTemplate(name="Merged", age=30)
+    raw_models = [
+        MockTemplate.model_construct(name=name, age=age)
+        for name, age in (("Test1", 30), ("Test2", 31))
+    ]
+    programmatic_model = MockTemplate.model_construct(name="Merged", age=30)
 
     # Mock Chain of Density prompts (list of 2 prompts)
     stage1_prompt = "Stage 1: Initial merge"
@@ -265,8 +294,8 @@ def test_consolidate_chain_of_density_stage2_fails(mock_get_prompt, llm_backend,
         model_id="gpt-4", context_limit=128000, capability=ModelCapability.ADVANCED
     )
 
-    raw_models = [MockTemplate(name="Test1", age=30)]
-    programmatic_model = MockTemplate(name="Merged", age=30)
+    raw_models = [MockTemplate.model_construct(name="Test1", age=30)]
+    programmatic_model = MockTemplate.model_construct(name="Merged", age=30)
 
     mock_get_prompt.return_value = ["Stage 1", "Stage 2: {stage1_result}"]
 
@@ -292,8 +321,8 @@ def test_consolidate_single_turn_simple_model(mock_get_prompt, llm_backend, mock
         model_id="phi-3", context_limit=4096, capability=ModelCapability.SIMPLE
     )
 
-    raw_models = [MockTemplate(name="Test1", age=30)]
-    programmatic_model = MockTemplate(name="Merged", age=30)
+    raw_models = [MockTemplate.model_construct(name="Test1", age=30)]
+    programmatic_model = MockTemplate.model_construct(name="Merged", age=30)
 
     # Mock single prompt (string, not list)
     mock_get_prompt.return_value = "Single consolidation prompt"
@@ -312,12 +341,8 @@ def test_consolidate_single_turn_simple_model(mock_get_prompt, llm_backend, mock
 def test_cleanup_without_cleanup_method(mock_llm_client):
     """Test cleanup when client doesn't have cleanup method."""
     # Client without cleanup method
-    mock_llm_client_no_cleanup = MagicMock(spec=BaseLlmClient)
-    mock_llm_client_no_cleanup.__class__.__name__ = "MockClient"
-    mock_llm_client_no_cleanup.context_limit = 8192  # Set as integer
-    # Explicitly remove cleanup if it exists
-    if hasattr(mock_llm_client_no_cleanup, "cleanup"):
-        delattr(mock_llm_client_no_cleanup, "cleanup")
+    mock_llm_client_no_cleanup = StubLlmClient(context_limit=8192)
+    assert not hasattr(mock_llm_client_no_cleanup, "cleanup")
 
     backend = LlmBackend(llm_client=mock_llm_client_no_cleanup)
 
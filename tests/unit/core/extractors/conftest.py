@@ -61,9 +61,9 @@ class ComplexSchema(BaseModel):
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_tokenizer():
-    """Mock tokenizer for testing."""
+    """Mock tokenizer for testing (stateless, shared across the module)."""
     tokenizer = Mock()
     tokenizer.count_tokens = Mock(side_effect=lambda text: len(text) // 4)
     return tokenizer
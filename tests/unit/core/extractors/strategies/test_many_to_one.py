@@ -1,9 +1,11 @@
+import signal
 from typing import List, Optional
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
+from docling_graph.core.extractors.backends.llm_backend import LlmBackend
 from docling_graph.core.extractors.strategies.many_to_one import ManyToOneStrategy
 from docling_graph.protocols import ExtractionBackendProtocol, TextExtractionBackendProtocol
 
@@ -12,6 +14,14 @@ class MockTemplate(BaseModel):
     name: str
     value: int = 0
 
+    model_config = ConfigDict(frozen=True)
+
+
+MERGED_MODEL = MockTemplate.model_construct(name="Merged", value=123)
+
+# Markdown well past the small context limits used to force page-by-page mode
+LARGE_DOC = "x" * 10000
+
 
 @pytest.fixture
 def mock_llm_backend():
@@ -22,12 +32,12 @@ def mock_llm_backend():
     def mock_extract(markdown, template, context, is_partial) -> MockTemplate | None:
         if "fail" in markdown:
             return None
-        return template(name=context, value=len(markdown))
+        return template.model_construct(name=context, value=len(markdown))
 
     backend.extract_from_markdown.side_effect = mock_extract
 
     def mock_consolidate(raw_models, programmatic_model, template) -> MockTemplate:
-        return template(name="Consolidated", value=999)
+        return template.model_construct(name="Consolidated", value=999)
 
     backend.consolidate_from_pydantic_models.side_effect = mock_consolidate
 
@@ -41,11 +51,11 @@ def mock_vlm_backend():
 
     def mock_extract(source, template) -> List[MockTemplate]:
         if "single" in source:
-            return [template(name="Page 1", value=10)]
+            return [template.model_construct(name="Page 1", value=10)]
         if "multi" in source:
             return [
-                template(name="Page 1", value=10),
-                template(name="Page 2", value=20),
+                template.model_construct(name="Page 1", value=10),
+                template.model_construct(name="Page 2", value=20),
             ]
         return []
 
@@ -54,8 +64,9 @@ def mock_vlm_backend():
     return backend
 
 
-@pytest.fixture(autouse=True)
-def patch_deps():
+@pytest.fixture(scope="module", autouse=True)
+def module_patches():
+    """Patch strategy dependencies once for the whole module."""
     with (
         patch("docling_graph.core.extractors.strategies.many_to_one.DocumentProcessor") as mock_dp,
         patch("docling_graph.core.extractors.strategies.many_to_one.ChunkBatcher") as mock_cb,
@@ -65,24 +76,35 @@ def patch_deps():
         patch("docling_graph.core.extractors.strategies.many_to_one.is_llm_backend") as mock_is_llm,
         patch("docling_graph.core.extractors.strategies.many_to_one.is_vlm_backend") as mock_is_vlm,
     ):
-        mock_doc_processor = mock_dp.return_value
-        mock_doc_processor.convert_to_docling_doc.return_value = "MockDoc"
-        mock_doc_processor.extract_chunks.return_value = ["chunk1", "chunk2"]
-        mock_doc_processor.extract_page_markdowns.return_value = ["page1_md", "page2_md"]
-        mock_doc_processor.extract_full_markdown.return_value = "full_doc_md"
+        yield mock_dp, mock_cb, mock_merge, mock_is_llm, mock_is_vlm
 
-        mock_batcher = mock_cb.return_value
-        mock_batcher.batch_chunks.return_value = [
-            MagicMock(batch_id=0, chunk_count=2, combined_text="chunk1chunk2")
-        ]
 
-        mock_merge.return_value = MockTemplate(name="Merged", value=123)
+@pytest.fixture(autouse=True)
+def patch_deps(module_patches):
+    """Reset the module-level patches to their default behaviour for each test."""
+    mock_dp, mock_cb, mock_merge, mock_is_llm, mock_is_vlm = module_patches
+    for mock in module_patches:
+        # Fresh return_value children drop attributes set by earlier tests
+        mock.reset_mock(return_value=True, side_effect=True)
 
-        # Default: not LLM, not VLM (will be overridden in tests)
-        mock_is_llm.return_value = False
-        mock_is_vlm.return_value = False
+    mock_doc_processor = mock_dp.return_value
+    mock_doc_processor.convert_to_docling_doc.return_value = "MockDoc"
+    mock_doc_processor.extract_chunks.return_value = ["chunk1", "chunk2"]
+    mock_doc_processor.extract_page_markdowns.return_value = ["page1_md", "page2_md"]
+    mock_doc_processor.extract_full_markdown.return_value = "full_doc_md"
 
-        yield mock_dp, mock_cb, mock_merge, mock_is_llm, mock_is_vlm
+    mock_batcher = mock_cb.return_value
+    mock_batcher.batch_chunks.return_value = [
+        MagicMock(batch_id=0, chunk_count=2, combined_text="chunk1chunk2")
+    ]
+
+    mock_merge.return_value = MERGED_MODEL
+
+    # Default: not LLM, not VLM (will be overridden in tests)
+    mock_is_llm.return_value = False
+    mock_is_vlm.return_value = False
+
+    return module_patches
 
 
 def test_init_llm_chunking(mock_llm_backend, patch_deps):
@@ -149,6 +171,20 @@ def test_tokenizer_passing_to_batcher(mock_llm_backend, patch_deps):
     assert call_kwargs["tokenizer_fn"] == mock_count_tokens
 
 
+@pytest.mark.parametrize("fast_token_estimate", [False, True])
+def test_fast_token_estimate_passed_to_batcher(mock_llm_backend, patch_deps, fast_token_estimate):
+    """Test that the fast_token_estimate option configures the ChunkBatcher."""
+    _, mock_cb, _, mock_is_llm, _ = patch_deps
+    mock_is_llm.return_value = True
+
+    strategy = ManyToOneStrategy(
+        backend=mock_llm_backend, use_chunking=True, fast_token_estimate=fast_token_estimate
+    )
+    strategy.extract("test.pdf", MockTemplate)
+
+    assert mock_cb.call_args.kwargs["fast_estimate"] is fast_token_estimate
+
+
 def test_tokenizer_passing_when_no_chunker(mock_llm_backend, patch_deps):
     """Test graceful handling when chunker doesn't exist."""
     mock_dp, mock_cb, _, mock_is_llm, _ = patch_deps
@@ -266,7 +302,7 @@ def test_error_recovery_page_by_page_merge_failure(mock_llm_backend, patch_deps)
     # Force page-by-page mode by making document too large
     mock_llm_backend.client.context_limit = 1000
     mock_doc_processor = mock_dp.return_value
-    mock_doc_processor.extract_full_markdown.return_value = "x" * 10000  # Large doc
+    mock_doc_processor.extract_full_markdown.return_value = LARGE_DOC
 
     strategy = ManyToOneStrategy(backend=mock_llm_backend, use_chunking=False)
     results, _ = strategy.extract("test.pdf", MockTemplate)
@@ -277,6 +313,78 @@ def test_error_recovery_page_by_page_merge_failure(mock_llm_backend, patch_deps)
     assert results[1].name == "Page2"
 
 
+def test_page_by_page_uses_async_backend_when_opted_in(mock_llm_backend, patch_deps):
+    """Test that max_concurrent_pages > 1 dispatches all pages through the async extractor."""
+    mock_dp, _, mock_merge, mock_is_llm, _ = patch_deps
+    mock_is_llm.return_value = True
+    mock_merge.return_value = None
+
+    async def mock_extract_async(markdown, template, context, is_partial) -> MockTemplate:
+        return template.model_construct(name=context, value=len(markdown))
+
+    mock_llm_backend.extract_from_markdown_async = AsyncMock(side_effect=mock_extract_async)
+    mock_llm_backend.client.context_limit = 1000
+    mock_dp.return_value.extract_full_markdown.return_value = LARGE_DOC
+
+    strategy = ManyToOneStrategy(
+        backend=mock_llm_backend, use_chunking=False, max_concurrent_pages=2
+    )
+    with patch("docling_graph.core.extractors.strategies.many_to_one.rich_print") as mock_print:
+        results, _ = strategy.extract("test.pdf", MockTemplate)
+
+    assert mock_llm_backend.extract_from_markdown_async.await_count == 2
+    mock_llm_backend.extract_from_markdown.assert_not_called()
+    # Results keep page order
+    assert [r.name for r in results] == ["page 1", "page 2"]
+    printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+    assert "page 1/2" in printed
+    assert "page 2/2" in printed
+
+
+def test_page_by_page_sequential_by_default(mock_llm_backend, patch_deps):
+    """Test that pages are extracted one by one unless concurrency is requested."""
+    mock_dp, _, mock_merge, mock_is_llm, _ = patch_deps
+    mock_is_llm.return_value = True
+    mock_merge.return_value = None
+
+    mock_llm_backend.extract_from_markdown_async = AsyncMock()
+    mock_llm_backend.client.context_limit = 1000
+    mock_dp.return_value.extract_full_markdown.return_value = LARGE_DOC
+
+    strategy = ManyToOneStrategy(backend=mock_llm_backend, use_chunking=False)
+    results, _ = strategy.extract("test.pdf", MockTemplate)
+
+    assert strategy.max_concurrent_pages == 1
+    mock_llm_backend.extract_from_markdown_async.assert_not_awaited()
+    assert [r.name for r in results] == ["page 1", "page 2"]
+
+
+class SignalTimeoutClient:
+    """LLM client guarding requests with SIGALRM, like the vLLM client."""
+
+    context_limit = 1000
+
+    def get_json_response(self, prompt, schema_json):
+        # Raises ValueError when called outside the main thread
+        old_handler = signal.signal(signal.SIGALRM, signal.SIG_IGN)
+        signal.signal(signal.SIGALRM, old_handler)
+        return {"name": "Signal", "value": 1}
+
+
+def test_page_by_page_signal_based_client(patch_deps):
+    """Test that a client installing signal handlers still extracts every page."""
+    mock_dp, _, mock_merge, mock_is_llm, _ = patch_deps
+    mock_is_llm.return_value = True
+    mock_merge.return_value = None
+    mock_dp.return_value.extract_full_markdown.return_value = LARGE_DOC
+
+    backend = LlmBackend(llm_client=SignalTimeoutClient())
+    strategy = ManyToOneStrategy(backend=backend, use_chunking=False)
+    results, _ = strategy.extract("test.pdf", MockTemplate)
+
+    assert results == [MockTemplate(name="Signal", value=1)] * 2
+
+
 def test_zero_data_loss_no_models_extracted(mock_llm_backend, patch_deps):
     """Test that empty list is returned when no models extracted (no data to preserve)."""
     _mock_dp, mock_cb, _, mock_is_llm, _ = patch_deps
@@ -8,6 +8,17 @@ from docling_graph.core.extractors.chunk_batcher import (
 )
 from docling_graph.llm_clients.config import get_provider_config, list_providers
 
+# Chunk texts built once; with a word-count tokenizer, WORD_N is N tokens
+WORD_10 = "word " * 10
+WORD_50 = "word " * 50
+WORD_100 = "word " * 100
+WORD_200 = "word " * 200
+WORD_240 = "word " * 240
+WORD_260 = "word " * 260
+WORD_280 = "word " * 280
+WORD_300 = "word " * 300
+WORD_400 = "word " * 400
+
 
 def test_chunk_batch_properties():
     """Test ChunkBatch dataclass properties."""
@@ -24,6 +35,9 @@ def test_chunk_batch_properties():
     assert "[Chunk 1/2]" in combined
     assert "[Chunk 2/2]" in combined
     assert "---CHUNK BOUNDARY---" in combined
+    assert combined == "[Chunk 1/2]\nchunk1\n\n---CHUNK BOUNDARY---\n\n[Chunk 2/2]\nchunk2"
+    # Built once and reused on later access
+    assert batch.combined_text is combined
 
 
 def test_batcher_init():
@@ -49,7 +63,7 @@ def test_batch_chunks_simple():
     def count_tokens(text: str) -> int:
         return len(text.split())
 
-    chunks = ["word " * 200, "word " * 300, "word " * 400]  # 200, 300, 400 tokens
+    chunks = [WORD_200, WORD_300, WORD_400]  # 200, 300, 400 tokens
     batches = batcher.batch_chunks(chunks, tokenizer_fn=count_tokens)
 
     # With merge threshold at 85%, batching will try to fit chunks efficiently
@@ -71,8 +85,8 @@ def test_batch_chunks_multiple_batches():
         return len(text.split())
 
     chunks = [
-        "word " * 400,  # Batch 1 (400 + 50 overhead = 450)
-        "word " * 300,  # Batch 2 (300 + 50 overhead = 350)
+        WORD_400,  # Batch 1 (400 + 50 overhead = 450)
+        WORD_300,  # Batch 2 (300 + 50 overhead = 350)
     ]
 
     batches = batcher.batch_chunks(chunks, tokenizer_fn=count_tokens)
@@ -94,8 +108,8 @@ def test_batch_chunks_with_merge():
         return len(text.split())
 
     chunks = [
-        "word " * 200,  # Small chunk
-        "word " * 100,  # Another small chunk - should merge
+        WORD_200,  # Small chunk
+        WORD_100,  # Another small chunk - should merge
     ]
 
     batches = batcher.batch_chunks(chunks, tokenizer_fn=count_tokens)
@@ -207,7 +221,7 @@ def test_batch_chunks_with_real_tokenizer_priority():
     def precise_tokenizer(text: str) -> int:
         return len(text.split())
 
-    chunks = ["word " * 50, "word " * 50]  # 50 tokens each
+    chunks = [WORD_50, WORD_50]  # 50 tokens each
     batches = batcher.batch_chunks(chunks, tokenizer_fn=precise_tokenizer)
 
     # Should use real tokenizer, not heuristic
@@ -229,7 +243,7 @@ def test_batch_chunks_prevents_overflow():
     # 240 tokens * 1.2 safety = 288 tokens (fits)
     # 250 tokens * 1.2 safety = 300 tokens (exactly fits)
     # 260 tokens * 1.2 safety = 312 tokens (overflow, needs new batch)
-    chunks = ["word " * 240, "word " * 260]
+    chunks = [WORD_240, WORD_260]
 
     batches = batcher.batch_chunks(chunks, tokenizer_fn=count_tokens)
 
@@ -239,6 +253,102 @@ def test_batch_chunks_prevents_overflow():
     assert batches[1].chunk_count == 1
 
 
+def test_batch_chunks_with_batch_tokenizer():
+    """Test that a batch tokenizer counts all chunks in a single call."""
+    batcher = ChunkBatcher(context_limit=500, system_prompt_tokens=100, response_buffer_tokens=100)
+
+    calls = []
+
+    def batch_count_tokens(texts: list[str]) -> list[int]:
+        calls.append(texts)
+        return [len(text.split()) for text in texts]
+
+    def per_chunk_tokenizer(text: str) -> int:
+        raise AssertionError("per-chunk tokenizer should not be used")
+
+    chunks = [WORD_240, WORD_260]
+    batches = batcher.batch_chunks(
+        chunks, tokenizer_fn=per_chunk_tokenizer, batch_tokenizer_fn=batch_count_tokens
+    )
+
+    assert calls == [chunks]
+    # Same result as per-chunk counting (see test_batch_chunks_prevents_overflow)
+    assert len(batches) == 2
+    assert batches[0].total_tokens == int(240 * 1.2) + 50
+
+
+def test_estimate_tokens_batch_fallback_on_error():
+    """Test that a failing batch tokenizer falls back to per-chunk estimation."""
+    batcher = ChunkBatcher(context_limit=1000, system_prompt_tokens=250, response_buffer_tokens=250)
+
+    def failing_batch_tokenizer(texts: list[str]) -> list[int]:
+        raise ValueError("Tokenizer error")
+
+    tokens = batcher._estimate_tokens_batch(
+        ["a" * 300, "b b"],
+        tokenizer_fn=lambda text: len(text.split()),
+        batch_tokenizer_fn=failing_batch_tokenizer,
+    )
+    assert tokens == [1, 2]
+
+
+def test_fast_estimate_skips_tokenizer_for_obvious_fits():
+    """Test that fast estimation only tokenizes chunks near the batch limit."""
+    batcher = ChunkBatcher(
+        context_limit=1000,
+        system_prompt_tokens=250,
+        response_buffer_tokens=250,
+        fast_estimate=True,
+    )
+
+    counted = []
+
+    def count_tokens(text: str) -> int:
+        counted.append(text)
+        return len(text.split())
+
+    small = WORD_10  # ~17 tokens estimated, far from the 500 budget
+    near_limit = WORD_280  # pushes the batch close to the budget
+    batches = batcher.batch_chunks([small, near_limit], tokenizer_fn=count_tokens)
+
+    assert counted == [near_limit]
+    assert sum(b.chunk_count for b in batches) == 2
+
+
+def test_fast_estimate_without_tokenizer():
+    """Test word-count estimation applies subword ratio and safety margin."""
+    batcher = ChunkBatcher(context_limit=1000, fast_estimate=True)
+
+    # 100 words * 1.3 * 1.2 = 156
+    assert batcher._fast_estimate_tokens(" ".join(["word"] * 100)) == 156
+
+
+def test_fast_estimate_text_without_spaces():
+    """Test that text with no whitespace is estimated from its length, not its word count."""
+    batcher = ChunkBatcher(
+        context_limit=1000,
+        system_prompt_tokens=250,
+        response_buffer_tokens=250,
+        fast_estimate=True,
+    )
+
+    no_spaces = "数据" * 1000  # 2000 chars, a single "word"
+    # 2000 chars / 4 * 1.2 = 600
+    assert batcher._fast_estimate_tokens(no_spaces) == 600
+
+    counted = []
+
+    def count_tokens(text: str) -> int:
+        counted.append(text)
+        return len(text)
+
+    batches = batcher.batch_chunks([WORD_10, no_spaces], tokenizer_fn=count_tokens)
+
+    # The oversized chunk is not packed with the first one
+    assert len(batches) == 2
+    assert [b.chunk_indices for b in batches] == [[0], [1]]
+
+
 def test_tokenizer_fallback_on_error():
     """Test that batcher falls back to heuristic if tokenizer fails."""
     batcher = ChunkBatcher(context_limit=1000, system_prompt_tokens=250, response_buffer_tokens=250)
@@ -2,7 +2,35 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from docling_graph.core.extractors.document_chunker import DocumentChunker
+from docling_graph.core.extractors.document_chunker import DocumentChunker, _load_tokenizer
+
+
+@pytest.fixture(scope="module", autouse=True)
+def module_patches():
+    """Patch the chunker's tokenizer and HybridChunker once for the whole module."""
+    with (
+        patch("docling_graph.core.extractors.document_chunker.HybridChunker") as mock_hybrid,
+        patch("docling_graph.core.extractors.document_chunker.HuggingFaceTokenizer") as mock_hf,
+        patch("docling_graph.core.extractors.document_chunker.AutoTokenizer") as mock_auto,
+    ):
+        yield mock_hybrid, mock_hf, mock_auto
+
+
+@pytest.fixture(autouse=True)
+def patch_deps(module_patches):
+    """Reset the module-level patches for each test (HybridChunker, HF wrapper, AutoTokenizer)."""
+    for mock in module_patches:
+        # Fresh return_value children drop attributes set by earlier tests
+        mock.reset_mock(return_value=True, side_effect=True)
+    return module_patches
+
+
+@pytest.fixture(autouse=True)
+def clear_tokenizer_cache():
+    """Drop cached tokenizers so each test sees its own patched AutoTokenizer."""
+    _load_tokenizer.cache_clear()
+    yield
+    _load_tokenizer.cache_clear()
 
 
 @pytest.fixture
@@ -22,13 +50,55 @@ def mock_hf_tokenizer_wrapper():
     return wrapper
 
 
-@patch("docling_graph.core.extractors.document_chunker.AutoTokenizer")
-@patch("docling_graph.core.extractors.document_chunker.HuggingFaceTokenizer")
-@patch("docling_graph.core.extractors.document_chunker.HybridChunker")
-def test_chunker_init_with_tokenizer_name(
-    mock_hybrid_chunker, mock_hf_tokenizer_class, mock_auto_tokenizer
-):
+class StubBatchTokenizer:
+    """Callable stand-in for a HuggingFace tokenizer's batch API."""
+
+    def __init__(self, *lengths_per_call):
+        self._lengths_per_call = list(lengths_per_call)
+        self.calls = []
+
+    def __call__(self, texts, **kwargs):
+        self.calls.append((texts, kwargs))
+        return {"length": self._lengths_per_call.pop(0)}
+
+
+class StubTokenizerWrapper:
+    """Stand-in for docling's HuggingFaceTokenizer wrapper."""
+
+    def __init__(self, backend, counts=()):
+        self._backend = backend
+        self._counts = list(counts)
+        self.count_calls = 0
+
+    def get_tokenizer(self):
+        return self._backend
+
+    def count_tokens(self, text):
+        self.count_calls += 1
+        return self._counts.pop(0) if self._counts else 10
+
+
+class StubHybridChunker:
+    """Stand-in for HybridChunker: chunk() yields preset texts, contextualize() is identity."""
+
+    def __init__(self, chunks_by_doc):
+        self._chunks_by_doc = chunks_by_doc
+
+    def chunk(self, dl_doc):
+        return iter(self._chunks_by_doc[dl_doc])
+
+    def contextualize(self, chunk):
+        return chunk
+
+
+def batch_kwargs(texts):
+    """Expected batch tokenizer call for ``texts``."""
+    return (texts, {"add_special_tokens": False, "return_length": True})
+
+
+def test_chunker_init_with_tokenizer_name(patch_deps):
     """Test initialization with a specific tokenizer name."""
+    mock_hybrid_chunker, mock_hf_tokenizer_class, mock_auto_tokenizer = patch_deps
     mock_tokenizer_instance = MagicMock()
     mock_auto_tokenizer.from_pretrained.return_value = mock_tokenizer_instance
 
@@ -43,7 +113,11 @@ def test_chunker_init_with_tokenizer_name(
 
     chunker = DocumentChunker(**config)
 
-    mock_auto_tokenizer.from_pretrained.assert_called_with("test-model")
+    mock_auto_tokenizer.from_pretrained.assert_called_with("test-model", use_fast=True)
+
+    # A second chunker with the same tokenizer reuses the cached instance
+    DocumentChunker(**config)
+    mock_auto_tokenizer.from_pretrained.assert_called_once_with("test-model", use_fast=True)
     mock_hybrid_chunker.assert_called_with(
         tokenizer=mock_wrapper,
         merge_peers=False,
@@ -54,13 +128,9 @@ def test_chunker_init_with_tokenizer_name(
 
 
 @patch("docling_graph.core.extractors.document_chunker.get_tokenizer_for_provider")
-@patch("docling_graph.core.extractors.document_chunker.AutoTokenizer")
-@patch("docling_graph.core.extractors.document_chunker.HuggingFaceTokenizer")
-@patch("docling_graph.core.extractors.document_chunker.HybridChunker")
-def test_chunker_init_with_provider(
-    mock_hybrid_chunker, mock_hf_tokenizer_class, mock_auto_tokenizer, mock_get_tokenizer
-):
+def test_chunker_init_with_provider(mock_get_tokenizer, patch_deps):
     """Test initialization using a provider shortcut."""
+    mock_hybrid_chunker, mock_hf_tokenizer_class, mock_auto_tokenizer = patch_deps
     expected_name = "mistralai/Mistral-7B-Instruct-v0.2"
     mock_get_tokenizer.return_value = expected_name
 
@@ -74,14 +144,13 @@ def test_chunker_init_with_provider(
     chunker = DocumentChunker(**config)
 
     mock_get_tokenizer.assert_called_with("mistral")
+    mock_auto_tokenizer.from_pretrained.assert_called_with(expected_name, use_fast=True)
     assert chunker.tokenizer_name == expected_name
 
 
-@patch("docling_graph.core.extractors.document_chunker.AutoTokenizer")
-@patch("docling_graph.core.extractors.document_chunker.HuggingFaceTokenizer")
-@patch("docling_graph.core.extractors.document_chunker.HybridChunker")
-def test_chunk_document(mock_hybrid_chunker_class, mock_hf_tokenizer_class, mock_auto_tokenizer):
+def test_chunk_document(patch_deps):
     """Test the chunk_document method."""
+    mock_hybrid_chunker_class, mock_hf_tokenizer_class, mock_auto_tokenizer = patch_deps
     mock_tokenizer_instance = MagicMock()
     mock_auto_tokenizer.from_pretrained.return_value = mock_tokenizer_instance
 
@@ -107,47 +176,78 @@ def test_chunk_document(mock_hybrid_chunker_class, mock_hf_tokenizer_class, mock
     assert mock_chunker_instance.contextualize.call_count == 2
 
 
-@patch("docling_graph.core.extractors.document_chunker.AutoTokenizer")
-@patch("docling_graph.core.extractors.document_chunker.HuggingFaceTokenizer")
-@patch("docling_graph.core.extractors.document_chunker.HybridChunker")
-def test_chunk_document_with_stats(
-    mock_hybrid_chunker_class, mock_hf_tokenizer_class, mock_auto_tokenizer
-):
+def test_chunk_document_with_stats(patch_deps):
     """Test the stats-enabled chunking method."""
-    mock_tokenizer_instance = MagicMock()
-    mock_auto_tokenizer.from_pretrained.return_value = mock_tokenizer_instance
-
-    mock_wrapper = MagicMock()
-    mock_wrapper.count_tokens.side_effect = [150, 250]
-    mock_hf_tokenizer_class.return_value = mock_wrapper
-
-    mock_chunker_instance = MagicMock()
-    mock_hybrid_chunker_class.return_value = mock_chunker_instance
-
-    mock_chunk1 = MagicMock()
-    mock_chunk2 = MagicMock()
-    mock_chunker_instance.chunk.return_value = iter([mock_chunk1, mock_chunk2])
-    mock_chunker_instance.contextualize.side_effect = ["chunk1_text", "chunk2_text"]
+    mock_hybrid_chunker_class, mock_hf_tokenizer_class, mock_auto_tokenizer = patch_deps
+    backend = StubBatchTokenizer([150, 250])
+    wrapper = StubTokenizerWrapper(backend)
+    mock_hf_tokenizer_class.return_value = wrapper
+    mock_hybrid_chunker_class.return_value = StubHybridChunker(
+        {"doc": ["chunk1_text", "chunk2_text"]}
+    )
 
     chunker = DocumentChunker(max_tokens=1024)
-    mock_doc = MagicMock()
 
-    chunks, stats = chunker.chunk_document_with_stats(mock_doc)
+    chunks, stats = chunker.chunk_document_with_stats("doc")
 
     assert chunks == ["chunk1_text", "chunk2_text"]
     assert stats["total_chunks"] == 2
     assert stats["total_tokens"] == 400  # 150 + 250
     assert stats["avg_tokens"] == 200.0
     assert stats["max_tokens_in_chunk"] == 250
+    # Token counts come from a single batched call, not one call per chunk
+    assert backend.calls == [batch_kwargs(["chunk1_text", "chunk2_text"])]
+    assert wrapper.count_calls == 0
+
+
+def test_count_tokens_batch(patch_deps):
+    """Test that batch counting makes a single call to the underlying tokenizer."""
+    mock_hybrid_chunker_class, mock_hf_tokenizer_class, mock_auto_tokenizer = patch_deps
+    backend = StubBatchTokenizer([3, 5])
+    wrapper = StubTokenizerWrapper(backend)
+    mock_hf_tokenizer_class.return_value = wrapper
+
+    chunker = DocumentChunker(max_tokens=1024)
+
+    assert chunker.count_tokens_batch(["a b c", "d e f g h"]) == [3, 5]
+    assert backend.calls == [batch_kwargs(["a b c", "d e f g h"])]
+    assert wrapper.count_calls == 0
+    assert chunker.count_tokens_batch([]) == []
+
+
+def test_count_tokens_batch_caches_repeated_texts(patch_deps):
+    """Test that identical texts are tokenized once and served from the LRU cache."""
+    mock_hybrid_chunker_class, mock_hf_tokenizer_class, mock_auto_tokenizer = patch_deps
+    backend = StubBatchTokenizer([2, 4], [6])
+    mock_hf_tokenizer_class.return_value = StubTokenizerWrapper(backend)
+
+    chunker = DocumentChunker(max_tokens=1024)
+
+    with patch.object(DocumentChunker, "TOKEN_COUNT_CACHE_SIZE", 2):
+        assert chunker.count_tokens_batch(["header", "body", "header"]) == [2, 4, 2]
+        assert backend.calls == [batch_kwargs(["header", "body"])]
+
+        # Cached "header" is reused; the new text evicts the least recently used "body"
+        assert chunker.count_tokens_batch(["header", "footer"]) == [2, 6]
+        assert backend.calls[-1] == batch_kwargs(["footer"])
+        assert len(chunker._token_count_cache) == 2
+
+
+def test_count_tokens_batch_fallback(patch_deps):
+    """Test per-text fallback when the tokenizer has no batch API."""
+    mock_hybrid_chunker_class, mock_hf_tokenizer_class, mock_auto_tokenizer = patch_deps
+    wrapper = StubTokenizerWrapper(backend=None, counts=[7, 9])
+    mock_hf_tokenizer_class.return_value = wrapper
+
+    chunker = DocumentChunker(max_tokens=1024)
 
+    assert chunker.count_tokens_batch(["one", "two"]) == [7, 9]
+    assert wrapper.count_calls == 2
 
-@patch("docling_graph.core.extractors.document_chunker.AutoTokenizer")
-@patch("docling_graph.core.extractors.document_chunker.HuggingFaceTokenizer")
-@patch("docling_graph.core.extractors.document_chunker.HybridChunker")
-def test_get_config_summary(
-    mock_hybrid_chunker_class, mock_hf_tokenizer_class, mock_auto_tokenizer
-):
+
+def test_get_config_summary(patch_deps):
     """Test the configuration summary."""
+    mock_hybrid_chunker_class, mock_hf_tokenizer_class, mock_auto_tokenizer = patch_deps
     mock_tokenizer_instance = MagicMock()
     mock_auto_tokenizer.from_pretrained.return_value = mock_tokenizer_instance
 
@@ -172,53 +272,59 @@ def test_get_config_summary(
 # ============================================================================
 
 
+def test_chunk_text_fallback(patch_deps):
+    """Test that the raw-text fallback splits on sentence boundaries or hard limits."""
+    mock_hybrid_chunker_class, mock_hf_tokenizer_class, mock_auto_tokenizer = patch_deps
+    chunker = DocumentChunker(max_tokens=10)  # 40 chars per chunk
+
+    sentences = "First sentence here. Second sentence here. Third one."
+    chunks = chunker.chunk_text_fallback(sentences)
+    assert chunks == ["First sentence here.", "Second sentence here. Third one."]
+
+    # No delimiter at all: hard split at the character limit
+    assert chunker.chunk_text_fallback("a" * 100) == ["a" * 40, "a" * 40, "a" * 20]
+    assert chunker.chunk_text_fallback("short") == ["short"]
+
+
 class TestDynamicChunkerConfiguration:
     """Tests for Fix 6: update_schema_config() method."""
 
-    def test_update_schema_config_basic(self):
+    def test_update_schema_config_basic(self, patch_deps):
         """Test basic schema configuration update."""
-        with (
-            patch("docling_graph.core.extractors.document_chunker.AutoTokenizer"),
-            patch("docling_graph.core.extractors.document_chunker.HuggingFaceTokenizer"),
-            patch("docling_graph.core.extractors.document_chunker.HybridChunker") as mock_hybrid,
-        ):
-            mock_chunker_instance = Mock()
-            mock_chunker_instance.max_tokens = 8000
-            mock_hybrid.return_value = mock_chunker_instance
-
-            # Create DocumentChunker
-            doc_chunker = DocumentChunker(max_tokens=8000)
-            doc_chunker.original_max_tokens = 8000
-
-            # Small schema (500 chars)
-            small_schema_size = 500
-            doc_chunker.update_schema_config(small_schema_size)
-
-            # Should reduce max_tokens by schema overhead
-            schema_overhead = int(small_schema_size / 3.5)
-            expected_tokens = 8000 - schema_overhead
-            assert doc_chunker.max_tokens == expected_tokens
-
-    def test_update_schema_config_large_schema(self):
+        mock_hybrid = patch_deps[0]
+        mock_chunker_instance = Mock()
+        mock_chunker_instance.max_tokens = 8000
+        mock_hybrid.return_value = mock_chunker_instance
+
+        # Create DocumentChunker
+        doc_chunker = DocumentChunker(max_tokens=8000)
+        doc_chunker.original_max_tokens = 8000
+
+        # Small schema (500 chars)
+        small_schema_size = 500
+        doc_chunker.update_schema_config(small_schema_size)
+
+        # Should reduce max_tokens by schema overhead
+        schema_overhead = int(small_schema_size / 3.5)
+        expected_tokens = 8000 - schema_overhead
+        assert doc_chunker.max_tokens == expected_tokens
+
+    def test_update_schema_config_large_schema(self, patch_deps):
         """Test configuration update with large schema."""
-        with (
-            patch("docling_graph.core.extractors.document_chunker.AutoTokenizer"),
-            patch("docling_graph.core.extractors.document_chunker.HuggingFaceTokenizer"),
-            patch("docling_graph.core.extractors.document_chunker.HybridChunker") as mock_hybrid,
-        ):
-            mock_chunker_instance = Mock()
-            mock_chunker_instance.max_tokens = 8000
-            mock_hybrid.return_value = mock_chunker_instance
+        mock_hybrid = patch_deps[0]
+        mock_chunker_instance = Mock()
+        mock_chunker_instance.max_tokens = 8000
+        mock_hybrid.return_value = mock_chunker_instance
 
-            doc_chunker = DocumentChunker(max_tokens=8000)
-            doc_chunker.original_max_tokens = 8000
+        doc_chunker = DocumentChunker(max_tokens=8000)
+        doc_chunker.original_max_tokens = 8000
 
-            # Large schema (10000 chars)
-            large_schema_size = 10000
-            doc_chunker.update_schema_config(large_schema_size)
+        # Large schema (10000 chars)
+        large_schema_size = 10000
+        doc_chunker.update_schema_config(large_schema_size)
 
-            # Should enforce minimum chunk size
-            assert doc_chunker.chunker.max_tokens >= 1000
+        # Should enforce minimum chunk size
+        assert doc_chunker.chunker.max_tokens >= 1000
 
     def test_update_schema_config_no_chunker(self):
         """Test update when chunker is None."""
@@ -229,45 +335,37 @@ class TestDynamicChunkerConfiguration:
         doc_chunker.update_schema_config(1000)
         assert doc_chunker.chunker is None
 
-    def test_update_schema_config_preserves_original(self):
+    def test_update_schema_config_preserves_original(self, patch_deps):
         """Test that original_max_tokens is preserved."""
-        with (
-            patch("docling_graph.core.extractors.document_chunker.AutoTokenizer"),
-            patch("docling_graph.core.extractors.document_chunker.HuggingFaceTokenizer"),
-            patch("docling_graph.core.extractors.document_chunker.HybridChunker") as mock_hybrid,
-        ):
-            mock_chunker_instance = Mock()
-            mock_chunker_instance.max_tokens = 8000
-            mock_hybrid.return_value = mock_chunker_instance
-
-            doc_chunker = DocumentChunker(max_tokens=8000)
-            doc_chunker.original_max_tokens = 8000
-
-            # Multiple updates
-            doc_chunker.update_schema_config(500)
-            doc_chunker.update_schema_config(1000)
-            doc_chunker.update_schema_config(2000)
-
-            # Original should remain unchanged
-            assert doc_chunker.original_max_tokens == 8000
-
-    def test_update_schema_config_edge_cases(self):
+        mock_hybrid = patch_deps[0]
+        mock_chunker_instance = Mock()
+        mock_chunker_instance.max_tokens = 8000
+        mock_hybrid.return_value = mock_chunker_instance
+
+        doc_chunker = DocumentChunker(max_tokens=8000)
+        doc_chunker.original_max_tokens = 8000
+
+        # Multiple updates
+        doc_chunker.update_schema_config(500)
+        doc_chunker.update_schema_config(1000)
+        doc_chunker.update_schema_config(2000)
+
+        # Original should remain unchanged
+        assert doc_chunker.original_max_tokens == 8000
+
+    def test_update_schema_config_edge_cases(self, patch_deps):
         """Test edge cases for schema configuration."""
-        with (
-            patch("docling_graph.core.extractors.document_chunker.AutoTokenizer"),
-            patch("docling_graph.core.extractors.document_chunker.HuggingFaceTokenizer"),
-            patch("docling_graph.core.extractors.document_chunker.HybridChunker") as mock_hybrid,
-        ):
-            mock_chunker_instance = Mock()
-            mock_chunker_instance.max_tokens = 2000
-            mock_hybrid.return_value = mock_chunker_instance
-
-            doc_chunker = DocumentChunker(max_tokens=2000)
-            doc_chunker.original_max_tokens = 2000
-
-            # Very large schema that would result in negative tokens
-            huge_schema_size = 20000
-            doc_chunker.update_schema_config(huge_schema_size)
-
-            # Should enforce minimum
-            assert doc_chunker.max_tokens == 1000
+        mock_hybrid = patch_deps[0]
+        mock_chunker_instance = Mock()
+        mock_chunker_instance.max_tokens = 2000
+        mock_hybrid.return_value = mock_chunker_instance
+
+        doc_chunker = DocumentChunker(max_tokens=2000)
+        doc_chunker.original_max_tokens = 2000
+
+        # Very large schema that would result in negative tokens
+        huge_schema_size = 20000
+        doc_chunker.update_schema_config(huge_schema_size)
+
+        # Should enforce minimum
+        assert doc_chunker.max_tokens == 1000
@@ -23,6 +23,7 @@ def test_init_default_ocr(mock_chunker_class, mock_converter_class):
 
     assert processor.docling_config == "ocr"
     assert processor.chunker is None
+    assert not hasattr(processor, "__dict__")  # slotted
     mock_converter_class.assert_called_once()
 
 
@@ -27,6 +27,34 @@ def test_create_llm_many_to_one(mock_strategy, mock_backend):
     mock_strategy.assert_called_once()
 
 
+@patch("docling_graph.core.extractors.factory.LlmBackend")
+@patch("docling_graph.core.extractors.factory.ManyToOneStrategy")
+def test_create_llm_many_to_one_forwards_max_concurrent_pages(mock_strategy, mock_backend):
+    """max_concurrent_pages should reach the many-to-one strategy for LLM backends."""
+    ExtractorFactory.create_extractor(
+        processing_mode="many-to-one",
+        backend_name="llm",
+        llm_client=MagicMock(),
+        max_concurrent_pages=4,
+    )
+
+    assert mock_strategy.call_args.kwargs["max_concurrent_pages"] == 4
+
+
+@patch("docling_graph.core.extractors.factory.LlmBackend")
+@patch("docling_graph.core.extractors.factory.ManyToOneStrategy")
+def test_create_llm_many_to_one_forwards_fast_token_estimate(mock_strategy, mock_backend):
+    """fast_token_estimate should reach the many-to-one strategy for LLM backends."""
+    ExtractorFactory.create_extractor(
+        processing_mode="many-to-one",
+        backend_name="llm",
+        llm_client=MagicMock(),
+        fast_token_estimate=True,
+    )
+
+    assert mock_strategy.call_args.kwargs["fast_token_estimate"] is True
+
+
 @patch("docling_graph.core.extractors.factory.VlmBackend")
 @patch("docling_graph.core.extractors.factory.ManyToOneStrategy")
 def test_create_vlm_many_to_one(mock_strategy, mock_backend):
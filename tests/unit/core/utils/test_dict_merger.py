@@ -1,9 +1,14 @@
+from datetime import date
 from typing import List, Optional
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
-from docling_graph.core.utils.dict_merger import merge_pydantic_models
+from docling_graph.core.utils.dict_merger import (
+    consolidate_extracted_data,
+    deep_merge_dicts,
+    merge_pydantic_models,
+)
 
 # --- Test Pydantic Models ---
 
@@ -110,3 +115,122 @@ def test_merge_no_models():
     assert isinstance(merged, DocumentModel)
     assert merged.title is None
     assert merged.content == []
+
+
+def test_deep_merge_dicts_simple_lists_keep_order():
+    """Test that scalar lists append only new items, in order, keeping the target list."""
+    tags = ["a", "b", "a"]
+    target = {"tags": tags}
+
+    deep_merge_dicts(target, {"tags": ["c", "b", "d", "c"]})
+
+    assert target["tags"] is tags
+    assert tags == ["a", "b", "a", "c", "d"]
+
+
+def test_deep_merge_dicts_unhashable_list_items():
+    """Test that lists of unhashable items fall back to membership checks."""
+    target = {"pairs": [[1, 2]]}
+
+    deep_merge_dicts(target, {"pairs": [[1, 2], [3, 4]]})
+
+    assert target["pairs"] == [[1, 2], [3, 4]]
+
+
+def test_merge_scalar_only_models_skips_revalidation(monkeypatch):
+    """Test that scalar-only templates are rebuilt with model_construct."""
+    calls = []
+    original_init = SimpleItem.__init__
+
+    def tracking_init(self, **data):
+        calls.append(data)
+        original_init(self, **data)
+
+    first = SimpleItem(name="A", value=1)
+    second = SimpleItem(name="B", value=2)
+    monkeypatch.setattr(SimpleItem, "__init__", tracking_init)
+
+    merged = merge_pydantic_models([first, second], SimpleItem)
+
+    assert isinstance(merged, SimpleItem)
+    assert (merged.name, merged.value) == ("B", 2)
+    assert calls == []
+
+
+class TaggedItem(BaseModel):
+    name: str
+    tags: List[str] = []
+
+
+def test_merge_scalar_only_models_leaves_inputs_untouched():
+    """Test that merging scalar-only models does not mutate the source models."""
+    first = TaggedItem(name="A", tags=["x"])
+    second = TaggedItem(name="B", tags=["x", "y"])
+
+    merged = merge_pydantic_models([first, second], TaggedItem)
+
+    assert merged.name == "B"
+    assert merged.tags == ["x", "y"]
+    assert first.tags == ["x"]
+    assert merged.tags is not second.tags
+
+
+class AliasedItem(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    full_name: str = Field(alias="fullName")
+
+
+class DatedItem(BaseModel):
+    day: date
+
+    @field_serializer("day")
+    def serialize_day(self, value: date) -> str:
+        return value.isoformat()
+
+
+def test_merge_models_with_field_alias():
+    """Test that aliased fields are merged by field name."""
+    merged = merge_pydantic_models(
+        [AliasedItem(fullName="Ada"), AliasedItem(fullName="Grace")], AliasedItem
+    )
+
+    assert isinstance(merged, AliasedItem)
+    assert merged.full_name == "Grace"
+
+
+def test_merge_models_with_custom_serializer():
+    """Test that values changed by a field serializer are validated back."""
+    merged = merge_pydantic_models(
+        [DatedItem(day=date(2024, 1, 1)), DatedItem(day=date(2024, 1, 2))], DatedItem
+    )
+
+    assert merged.day == date(2024, 1, 2)
+
+
+class Team(BaseModel):
+    name: str
+    members: list = []
+
+
+def test_merge_bare_list_models_dumps_nested_models():
+    """Test that nested models in a bare ``list`` field are merged as dicts."""
+    first = Team(name="A", members=[SimpleItem(name="x", value=1)])
+    second = Team(name="B", members=[SimpleItem(name="y", value=2)])
+
+    merged = merge_pydantic_models([first, second], Team)
+
+    assert merged.members == [{"name": "x", "value": 1}, {"name": "y", "value": 2}]
+
+
+def test_consolidate_extracted_data():
+    """Test that dicts are merged in order without mutating the inputs."""
+    first = {"title": "A", "note": None, "tags": ["x"]}
+    second = {"title": "B", "tags": ["y"]}
+
+    consolidated = consolidate_extracted_data([first, second, {"tags": ["x", "z"]}])
+
+    assert consolidated == {"title": "B", "note": None, "tags": ["x", "y", "z"]}
+    assert first == {"title": "A", "note": None, "tags": ["x"]}
+    assert consolidate_extracted_data([]) == {}
+    assert consolidate_extracted_data([first]) is first
@@ -71,6 +71,56 @@ def test_clean_graph(cleaner: GraphCleaner, dirty_graph: nx.DiGraph):
     assert cleaned_graph.has_edge("node-1", "node-2")
 
 
+def test_clean_graph_empty_graph(cleaner: GraphCleaner):
+    """Test that an empty graph is returned untouched."""
+    g = nx.DiGraph()
+
+    assert cleaner.clean_graph(g) is g
+    assert g.number_of_nodes() == 0
+
+
+def test_deduplicate_nodes_distinct_content(cleaner: GraphCleaner, monkeypatch):
+    """Test that no merge work is done when all nodes are distinct."""
+    g = nx.DiGraph()
+    g.add_node("A", name="Alice")
+    g.add_node("B", name="Bob")
+    g.add_edge("A", "B", label="KNOWS")
+
+    def fail_redirect(*args):
+        raise AssertionError("no redirect expected")
+
+    monkeypatch.setattr(cleaner, "_redirect_edges", fail_redirect)
+
+    assert cleaner._deduplicate_nodes(g) == 0
+    assert g.number_of_nodes() == 2
+
+
+def test_deduplicate_nodes_between_duplicate_groups(cleaner: GraphCleaner):
+    """Test that edges between two merged duplicates end up on the canonical nodes."""
+    g = nx.DiGraph()
+    g.add_node("alice-1", name="Alice")
+    g.add_node("acme-1", name="Acme")
+    g.add_node("alice-2", name="Alice")
+    g.add_node("acme-2", name="Acme")
+    g.add_edge("alice-2", "acme-2", label="WORKS_AT")
+
+    assert cleaner._deduplicate_nodes(g) == 2
+    assert sorted(g.nodes) == ["acme-1", "alice-1"]
+    assert list(g.edges(data="label")) == [("alice-1", "acme-1", "WORKS_AT")]
+
+
+def test_remove_duplicate_edges_multigraph(cleaner: GraphCleaner):
+    """Test that only parallel edges with the same label are removed."""
+    g = nx.MultiDiGraph()
+    g.add_edge("A", "B", label="KNOWS")
+    g.add_edge("A", "B", label="KNOWS")
+    g.add_edge("A", "B", label="KNOWS")
+    g.add_edge("A", "B", label="WORKS_WITH")
+
+    assert cleaner._remove_duplicate_edges(g) == 2
+    assert sorted(label for _, _, label in g.edges(data="label")) == ["KNOWS", "WORKS_WITH"]
+
+
 def test_validate_graph_structure_valid():
     """Test validation on a clean graph."""
     g = nx.DiGraph()
@@ -0,0 +1,53 @@
+from datetime import date
+from enum import Enum
+from typing import Annotated, Any, Dict, List, Literal, Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from docling_graph.core.utils.model_introspection import is_scalar_only_model
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class Leaf(BaseModel):
+    name: str
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        str,
+        Optional[int],
+        float | None,
+        List[str],
+        Dict[str, int],
+        tuple[int, ...],
+        Literal["a", "b"],
+        Annotated[str, Field(min_length=1)],
+        date,
+        Color,
+    ],
+)
+def test_scalar_annotations(annotation):
+    """Test that fields built only from scalar leaf types are scalar-only."""
+
+    class Model(BaseModel):
+        value: annotation  # type: ignore[valid-type]
+
+    assert is_scalar_only_model(Model)
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [Leaf, Optional[Leaf], List[Leaf], Dict[str, Leaf], list, dict, set, List, Any, object],
+)
+def test_model_holding_annotations(annotation):
+    """Test that nested models, bare containers and unknown types are not scalar-only."""
+
+    class Model(BaseModel):
+        value: annotation  # type: ignore[valid-type]
+
+    assert not is_scalar_only_model(Model)
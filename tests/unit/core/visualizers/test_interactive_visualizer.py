@@ -9,7 +9,10 @@ import networkx as nx
 import pandas as pd
 import pytest
 
-from docling_graph.core.visualizers.interactive_visualizer import InteractiveVisualizer
+from docling_graph.core.visualizers.interactive_visualizer import (
+    InteractiveVisualizer,
+    _load_template,
+)
 
 
 @pytest.fixture
@@ -215,7 +218,7 @@ class TestDisplayCytoscapeGraph:
 
         with patch("webbrowser.open"):
             output = visualizer.display_cytoscape_graph(
-                tmp_path, input_format="csv", open_browser=False
+                tmp_path, input_format="csv", output_path=tmp_path / "graph", open_browser=False
             )
 
         assert output.exists()
@@ -239,3 +242,26 @@ class TestDisplayCytoscapeGraph:
 
         with pytest.raises(ValueError):
             visualizer.display_cytoscape_graph(tmp_path, input_format="invalid")
+
+
+class TestWriteCytoscapeHtml:
+    """Test HTML export."""
+
+    def test_template_read_once(self, visualizer, tmp_path, monkeypatch):
+        """Should reuse the cached template across exports."""
+        _load_template.cache_clear()
+        elements = {"nodes": [], "edges": [], "meta": {}}
+        reads = []
+        original_read_text = Path.read_text
+
+        def tracking_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", tracking_read_text)
+        visualizer._write_cytoscape_html(elements, tmp_path / "a.html")
+        visualizer._write_cytoscape_html(elements, tmp_path / "b.html")
+        monkeypatch.undo()
+
+        assert len(reads) == 1
+        assert "const graphElements" in (tmp_path / "b.html").read_text(encoding="utf-8")
@@ -116,6 +116,39 @@ class TestExtractionStage:
         assert result.docling_document is not None
         assert result.extractor is mock_extractor
 
+    @patch("docling_graph.pipeline.stages.ExtractorFactory.create_extractor")
+    @patch("docling_graph.pipeline.stages.ExtractionStage._initialize_llm_client")
+    @patch("docling_graph.llm_clients.config.get_model_config")
+    def test_extraction_passes_extractor_tuning_options(
+        self, mock_get_model_config, mock_init_client, mock_factory
+    ):
+        """Test that page concurrency and token estimation settings reach the factory."""
+        from pydantic import BaseModel
+
+        class TestModel(BaseModel):
+            name: str
+
+        mock_get_model_config.return_value = MagicMock(context_limit=4096)
+        mock_init_client.return_value = Mock()
+        mock_extractor = Mock()
+        mock_extractor.extract.return_value = ([TestModel(name="Test")], Mock())
+        mock_factory.return_value = mock_extractor
+
+        config = PipelineConfig(
+            source="test.pdf",
+            template=TestModel,
+            backend="llm",
+            inference="local",
+            max_concurrent_pages=3,
+            fast_token_estimate=True,
+        )
+        context = PipelineContext(config=config, template=TestModel)
+
+        ExtractionStage().execute(context)
+
+        assert mock_factory.call_args.kwargs["max_concurrent_pages"] == 3
+        assert mock_factory.call_args.kwargs["fast_token_estimate"] is True
+
     @patch("docling_graph.pipeline.stages.ExtractorFactory.create_extractor")
     @patch("docling_graph.pipeline.stages.ExtractionStage._initialize_llm_client")
     @patch("docling_graph.llm_clients.config.get_model_config")